@@ -0,0 +1,218 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from image_utils import extract_canny_edges
+
+
+# 여러 장 가져오기에서 디코딩할 최대 변 길이
+# (타일은 캔버스 가로 1/3 이하로 줄어들기 때문에 원본 해상도는 필요 없음)
+BATCH_MAX_SIDE = 2048
+
+
+# JPEG 축소 디코딩 배율과 플래그 (큰 배율부터)
+_REDUCED_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+# 크기 정보가 들어 있는 JPEG SOF 마커 (DHT / JPG / DAC 제외)
+_JPEG_SOF_MARKERS = {
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+    0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF,
+}
+
+
+"""
+JPEG 헤더만 읽어서 (가로, 세로) 반환 - JPEG이 아니거나 읽을 수 없으면 None
+"""
+def read_jpeg_size(path):
+
+    try:
+        with open(path, "rb") as f:
+            if f.read(2) != b"\xff\xd8":
+                return None
+            while True:
+                byte = f.read(1)
+                if not byte:
+                    return None
+                if byte != b"\xff":
+                    continue
+                marker = f.read(1)
+                while marker == b"\xff":
+                    marker = f.read(1)
+                if not marker:
+                    return None
+                code = marker[0]
+                # 길이 필드가 없는 마커
+                if code == 0x01 or 0xD0 <= code <= 0xD9:
+                    continue
+                length = int.from_bytes(f.read(2), "big")
+                if code in _JPEG_SOF_MARKERS:
+                    data = f.read(5)
+                    if len(data) < 5:
+                        return None
+                    height = int.from_bytes(data[1:3], "big")
+                    width = int.from_bytes(data[3:5], "big")
+                    return width, height
+                f.seek(length - 2, os.SEEK_CUR)
+    except OSError:
+        return None
+
+
+"""
+파일을 읽을 imread 플래그
+- max_side보다 충분히 큰 JPEG만 축소 디코딩 (축소해도 max_side 이상이 되는 가장 큰 배율)
+- 작은 이미지 / PNG / BMP 등은 원본 해상도로 읽음 (단일 이미지 열기와 같은 외곽선)
+"""
+def read_flag_for(path, max_side=BATCH_MAX_SIDE):
+
+    size = read_jpeg_size(path)
+    if size is not None:
+        longest = max(size)
+        for factor, flag in _REDUCED_FLAGS:
+            if longest // factor >= max_side:
+                return flag
+    return cv2.IMREAD_COLOR
+
+
+"""
+작업 프로세스에서 실행: 디코딩 (큰 JPEG은 축소 디코딩) -> 외곽선 추출 -> 공유 메모리에 기록
+- 반환값: (경로, 공유 메모리 이름, shape) / 실패 시 (경로, None, None)
+- 결과 배열을 피클로 돌려보내지 않고 공유 메모리 이름만 넘김
+"""
+def decode_and_extract(path, max_side=BATCH_MAX_SIDE):
+
+    # 큰 JPEG은 디코딩 단계에서 바로 1/2 ~ 1/8 해상도로 읽고, 나머지는 원본대로 읽은 뒤
+    # max_side를 넘을 때만 줄임
+    img = cv2.imread(path, read_flag_for(path, max_side))
+    if img is None:
+        return path, None, None
+
+    h, w = img.shape[:2]
+    scale = max_side / max(h, w)
+    if scale < 1.0:
+        img = cv2.resize(
+            img,
+            (max(1, int(w * scale)), max(1, int(h * scale))),
+            interpolation=cv2.INTER_AREA
+        )
+
+    edges = extract_canny_edges(img)
+    del img
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, edges.nbytes))
+    np.ndarray(edges.shape, dtype=np.uint8, buffer=shm.buf)[:] = edges
+    name = shm.name
+    shm.close()
+    return path, name, edges.shape
+
+
+"""
+받아가지 않을 decode_and_extract 결과의 공유 메모리를 지움 (Future 완료 콜백)
+- 취소 / 실패한 작업은 공유 메모리가 없으므로 그냥 넘어감
+"""
+def discard_result(future):
+
+    if future.cancelled() or future.exception() is not None:
+        return
+    _, name, _ = future.result()
+    if name is None:
+        return
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shm.unlink()
+    shm.close()
+
+
+class SharedEdges:
+
+    """
+    작업 프로세스가 만든 공유 메모리 외곽선을 복사 없이 numpy 배열로 보는 객체
+    - 붙자마자 unlink 해서, 이 객체가 닫히면 메모리도 바로 반환됨
+    """
+    def __init__(self, path, name, shape):
+
+        self.path = path
+        self._shm = shared_memory.SharedMemory(name=name)
+        self._shm.unlink()
+        self.edges = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+
+    def release(self):
+        """
+        배열을 놓고 공유 메모리를 닫음
+        - 이 배열의 view를 다른 곳에서 아직 들고 있으면 닫을 수 없으므로 호출 전 정리 필요
+        """
+        if self._shm is None:
+            return
+        self.edges = None
+        self._shm.close()
+        self._shm = None
+
+
+class BatchEdgeImporter:
+
+    """
+    여러 이미지 파일을 작업 프로세스 풀에서 병렬로 디코딩 / 외곽선 추출
+    - poll()로 끝난 것부터 SharedEdges로 받아감 (GUI 스레드를 막지 않음)
+    """
+    def __init__(self, paths, max_side=BATCH_MAX_SIDE, max_workers=None):
+
+        # Qt 스레드가 떠 있는 프로세스를 fork 하지 않도록 spawn 사용
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers or min(len(paths), os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._futures = [
+            (path, self._executor.submit(decode_and_extract, path, max_side))
+            for path in paths
+        ]
+        self.failed = []
+
+    def poll(self):
+        """
+        지금까지 끝난 작업의 SharedEdges 목록 (실패한 경로는 failed에 쌓임)
+        """
+        results = []
+        pending = []
+        for path, future in self._futures:
+            if not future.done():
+                pending.append((path, future))
+                continue
+
+            try:
+                _, name, shape = future.result()
+            except Exception:
+                self.failed.append(path)
+                continue
+
+            if name is None:
+                self.failed.append(path)
+            else:
+                results.append(SharedEdges(path, name, shape))
+
+        self._futures = pending
+        return results
+
+    def is_done(self):
+        return not self._futures
+
+    def shutdown(self):
+        """
+        남은 작업을 취소하고 풀 종료 (작업이 끝나길 기다리지 않음 - GUI를 막지 않음)
+        - 이미 끝났지만 받아가지 않은 결과의 공유 메모리는 바로 정리
+        - 이미 돌고 있어 취소되지 않은 작업은 끝나는 대로 공유 메모리를 지움
+        """
+        for shared in self.poll():
+            shared.release()
+        for _, future in self._futures:
+            future.add_done_callback(discard_result)
+        self._futures = []
+        self._executor.shutdown(wait=False, cancel_futures=True)
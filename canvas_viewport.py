@@ -0,0 +1,128 @@
+class CanvasViewport:
+
+    """
+    메인 캔버스 미리보기의 확대/이동 변환
+    - 라벨(화면) 좌표 = (캔버스 좌표 - 중심) * scale + 라벨 중앙
+    - zoom 1.0 이 캔버스 전체가 라벨에 딱 맞는 상태
+    - 모든 변환은 실수로 계산해서 어떤 배율에서도 왕복 변환이 정확함
+    """
+    MIN_ZOOM = 1.0
+    MAX_SCALE = 8.0  # 실제 픽셀 기준 최대 800%
+
+    def __init__(self):
+
+        self.canvas_width = 0
+        self.canvas_height = 0
+        self.view_width = 0
+        self.view_height = 0
+        self.zoom = 1.0
+        self.center_x = 0.0
+        self.center_y = 0.0
+
+    def set_canvas_size(self, w, h):
+        self.canvas_width = w
+        self.canvas_height = h
+        self.reset()
+
+    def set_view_size(self, w, h):
+        self.view_width = w
+        self.view_height = h
+        self.clamp()
+
+    def reset(self):
+        """
+        전체 보기로 되돌림
+        """
+        self.zoom = 1.0
+        self.center_x = self.canvas_width / 2
+        self.center_y = self.canvas_height / 2
+
+    @property
+    def fit_scale(self):
+        if self.canvas_width <= 0 or self.canvas_height <= 0:
+            return 1.0
+        if self.view_width <= 0 or self.view_height <= 0:
+            return 1.0
+        return min(
+            self.view_width / self.canvas_width,
+            self.view_height / self.canvas_height
+        )
+
+    @property
+    def scale(self):
+        return self.fit_scale * self.zoom
+
+    @property
+    def max_zoom(self):
+        return max(self.MIN_ZOOM, self.MAX_SCALE / self.fit_scale)
+
+    # 좌표 변환
+
+    def canvas_to_label(self, x, y):
+        s = self.scale
+        return (
+            (x - self.center_x) * s + self.view_width / 2,
+            (y - self.center_y) * s + self.view_height / 2,
+        )
+
+    def label_to_canvas(self, x, y):
+        s = self.scale
+        return (
+            (x - self.view_width / 2) / s + self.center_x,
+            (y - self.view_height / 2) / s + self.center_y,
+        )
+
+    def visible_canvas_rect(self):
+        """
+        라벨에 보이는 캔버스 영역 (x0, y0, x1, y1) - 캔버스 범위로 잘림
+        """
+        x0, y0 = self.label_to_canvas(0, 0)
+        x1, y1 = self.label_to_canvas(self.view_width, self.view_height)
+        return (
+            max(0.0, x0),
+            max(0.0, y0),
+            min(float(self.canvas_width), x1),
+            min(float(self.canvas_height), y1),
+        )
+
+    # 확대 / 이동
+
+    def zoom_at(self, label_x, label_y, factor):
+        """
+        라벨 좌표 (label_x, label_y) 아래의 캔버스 지점을 고정한 채로 확대/축소
+        """
+        anchor_x, anchor_y = self.label_to_canvas(label_x, label_y)
+        self.zoom = max(self.MIN_ZOOM, min(self.max_zoom, self.zoom * factor))
+
+        s = self.scale
+        self.center_x = anchor_x - (label_x - self.view_width / 2) / s
+        self.center_y = anchor_y - (label_y - self.view_height / 2) / s
+        self.clamp()
+
+    def pan(self, dx, dy):
+        """
+        라벨 좌표 기준 (dx, dy) 만큼 화면을 끌어서 이동
+        """
+        s = self.scale
+        self.center_x -= dx / s
+        self.center_y -= dy / s
+        self.clamp()
+
+    def clamp(self):
+        """
+        캔버스가 화면 밖으로 완전히 벗어나지 않도록 중심을 제한
+        - 캔버스가 화면보다 작은 방향은 가운데 정렬
+        """
+        s = self.scale
+        half_w = self.view_width / 2 / s
+        half_h = self.view_height / 2 / s
+
+        if half_w * 2 >= self.canvas_width:
+            self.center_x = self.canvas_width / 2
+        else:
+            self.center_x = max(half_w, min(self.canvas_width - half_w, self.center_x))
+
+        if half_h * 2 >= self.canvas_height:
+            self.center_y = self.canvas_height / 2
+        else:
+            self.center_y = max(half_h, min(self.canvas_height - half_h, self.center_y))
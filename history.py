@@ -0,0 +1,313 @@
+from collections import deque
+from contextlib import contextmanager
+from functools import reduce
+
+
+# 되돌리기 기록 최대 개수 (항목 하나는 수십 바이트 - 타일 픽셀은 참조만 보관)
+DEFAULT_MAX_ENTRIES = 10000
+
+
+"""
+두 영역 (x0, y0, x1, y1)을 모두 덮는 영역
+- None은 캔버스 전체를 뜻하므로 어느 쪽이든 None이면 None
+"""
+def union_rect(a, b):
+
+    if a is None or b is None:
+        return None
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+"""
+배치 항목 (tile, x, y, w, h)이 덮는 캔버스 영역
+"""
+def entry_rect(entry):
+
+    _, x, y, w, h = entry
+    return (x, y, x + w, y + h)
+
+
+# 명령
+# - apply(target) / revert(target)은 바뀐 캔버스 영역 (x0, y0, x1, y1)을 반환 (None = 전체)
+# - target은 placed_images 리스트, set_bg_color((R, G, B)),
+#   set_placement_cursor((next_x, next_y, 줄 높이))를 가진 객체 (MainWindow)
+# - 타일 객체는 참조만 들고 있으므로 픽셀 데이터는 복사되지 않음
+
+
+class MoveCommand:
+
+    """
+    index 번째 배치를 (dx, dy) 만큼 이동
+    """
+    __slots__ = ("index", "dx", "dy")
+
+    def __init__(self, index, dx, dy):
+        self.index = index
+        self.dx = dx
+        self.dy = dy
+
+    def _shift(self, target, dx, dy):
+        entry = target.placed_images[self.index]
+        tile, x, y, w, h = entry
+        moved = (tile, x + dx, y + dy, w, h)
+        target.placed_images[self.index] = moved
+        return union_rect(entry_rect(entry), entry_rect(moved))
+
+    def apply(self, target):
+        return self._shift(target, self.dx, self.dy)
+
+    def revert(self, target):
+        return self._shift(target, -self.dx, -self.dy)
+
+    def merge(self, other):
+        if isinstance(other, MoveCommand) and other.index == self.index:
+            return MoveCommand(self.index, self.dx + other.dx, self.dy + other.dy)
+        return None
+
+
+class PlaceCommand:
+
+    """
+    index 위치에 배치 항목 (tile, x, y, w, h)를 끼워 넣음
+    - 자동 배치 위치(cursor: next_x, next_y, 현재 줄 높이)도 배치 전 / 후 값으로 함께 되돌림
+    """
+    __slots__ = ("index", "entry", "cursor_before", "cursor_after")
+
+    def __init__(self, index, entry, cursor_before=None, cursor_after=None):
+        self.index = index
+        self.entry = entry
+        self.cursor_before = cursor_before
+        self.cursor_after = cursor_after
+
+    def apply(self, target):
+        target.placed_images.insert(self.index, self.entry)
+        if self.cursor_after is not None:
+            target.set_placement_cursor(self.cursor_after)
+        return entry_rect(self.entry)
+
+    def revert(self, target):
+        del target.placed_images[self.index]
+        if self.cursor_before is not None:
+            target.set_placement_cursor(self.cursor_before)
+        return entry_rect(self.entry)
+
+    def merge(self, other):
+        return None
+
+
+class RemoveCommand:
+
+    """
+    index 번째 배치를 뺌 (되돌리면 같은 위치 / 같은 쌓임 순서로 복원)
+    """
+    __slots__ = ("index", "entry")
+
+    def __init__(self, index, entry):
+        self.index = index
+        self.entry = entry
+
+    def apply(self, target):
+        del target.placed_images[self.index]
+        return entry_rect(self.entry)
+
+    def revert(self, target):
+        target.placed_images.insert(self.index, self.entry)
+        return entry_rect(self.entry)
+
+    def merge(self, other):
+        return None
+
+
+class RetileCommand:
+
+    """
+    index 번째 배치의 타일을 바꿈 (색상 / 선 두께 / 부드러움 변경)
+    - 레지스트리의 공유 타일을 가리키므로 두 타일 모두 참조만 보관
+    """
+    __slots__ = ("index", "old_tile", "new_tile")
+
+    def __init__(self, index, old_tile, new_tile):
+        self.index = index
+        self.old_tile = old_tile
+        self.new_tile = new_tile
+
+    def _set(self, target, tile):
+        _, x, y, w, h = entry = target.placed_images[self.index]
+        target.placed_images[self.index] = (tile, x, y, w, h)
+        return entry_rect(entry)
+
+    def apply(self, target):
+        return self._set(target, self.new_tile)
+
+    def revert(self, target):
+        return self._set(target, self.old_tile)
+
+    def merge(self, other):
+        if isinstance(other, RetileCommand) and other.index == self.index:
+            return RetileCommand(self.index, self.old_tile, other.new_tile)
+        return None
+
+
+class BackgroundCommand:
+
+    """
+    배경색 변경 (R, G, B)
+    """
+    __slots__ = ("old_color", "new_color")
+
+    def __init__(self, old_color, new_color):
+        self.old_color = tuple(old_color)
+        self.new_color = tuple(new_color)
+
+    def apply(self, target):
+        target.set_bg_color(self.new_color)
+        return None
+
+    def revert(self, target):
+        target.set_bg_color(self.old_color)
+        return None
+
+    def merge(self, other):
+        if isinstance(other, BackgroundCommand):
+            return BackgroundCommand(self.old_color, other.new_color)
+        return None
+
+
+class CompoundCommand:
+
+    """
+    여러 명령을 한 번에 되돌리는 묶음 (예: 편집 창에서 여러 타일을 한 번에 추가)
+    """
+    __slots__ = ("commands",)
+
+    def __init__(self, commands):
+        self.commands = tuple(commands)
+
+    def apply(self, target):
+        return reduce(union_rect, [c.apply(target) for c in self.commands])
+
+    def revert(self, target):
+        return reduce(union_rect, [c.revert(target) for c in reversed(self.commands)])
+
+    def merge(self, other):
+        return None
+
+
+class EditHistory:
+
+    """
+    되돌리기 / 다시 하기 명령 기록
+    - 스냅샷 대신 작은 변경 명령(이동량, 바뀐 타일 참조 등)만 쌓음
+    - 같은 coalesce 키로 연달아 기록한 명령은 하나로 합침 (슬라이더 조작 한 번 = 항목 하나)
+      seal()을 부르면 다음 기록부터는 새 항목
+    - 되돌리는 중(replaying)에는 기록하지 않으므로 슬라이더 시그널 등이 다시 기록되지 않음
+    - undo() / redo()는 바뀐 캔버스 영역을 반환해서 그 부분만 다시 그릴 수 있게 함
+    """
+    def __init__(self, target, max_entries=DEFAULT_MAX_ENTRIES):
+
+        self.target = target
+        self._undo = deque(maxlen=max_entries)
+        self._redo = []
+        self._coalesce_key = None
+        self._group = None
+        self.replaying = False
+
+    def __len__(self):
+        return len(self._undo)
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._coalesce_key = None
+
+    def seal(self):
+        """
+        진행 중인 합치기를 끝냄 (다음 기록은 새 항목)
+        """
+        self._coalesce_key = None
+
+    def do(self, command, coalesce=None):
+        """
+        명령을 실행하고 기록 - 바뀐 영역 반환
+        """
+        dirty = command.apply(self.target)
+        self.record(command, coalesce)
+        return dirty
+
+    def record(self, command, coalesce=None):
+        """
+        이미 반영된 변경을 기록 (예: 드래그가 끝난 뒤 전체 이동량)
+        """
+        if self.replaying:
+            return
+
+        if self._group is not None:
+            self._group.append(command)
+            return
+
+        if coalesce is not None and coalesce == self._coalesce_key and self._undo:
+            merged = self._undo[-1].merge(command)
+            if merged is not None:
+                self._undo[-1] = merged
+                self._redo.clear()
+                return
+
+        self._undo.append(command)
+        self._redo.clear()
+        self._coalesce_key = coalesce
+
+    @contextmanager
+    def grouped(self):
+        """
+        with 블록 안에서 기록한 명령을 하나의 항목으로 묶음
+        """
+        if self._group is not None:
+            yield
+            return
+
+        self._group = []
+        try:
+            yield
+        finally:
+            commands, self._group = self._group, None
+            if len(commands) == 1:
+                self.record(commands[0])
+            elif commands:
+                self.record(CompoundCommand(commands))
+
+    def undo(self):
+        """
+        마지막 항목을 되돌림 - (되돌렸는지, 바뀐 영역)
+        """
+        if not self._undo:
+            return False, None
+        command = self._undo.pop()
+        dirty = self._replay(command.revert)
+        self._redo.append(command)
+        self._coalesce_key = None
+        return True, dirty
+
+    def redo(self):
+        """
+        되돌린 항목을 다시 실행 - (다시 했는지, 바뀐 영역)
+        """
+        if not self._redo:
+            return False, None
+        command = self._redo.pop()
+        dirty = self._replay(command.apply)
+        self._undo.append(command)
+        self._coalesce_key = None
+        return True, dirty
+
+    def _replay(self, step):
+        self.replaying = True
+        try:
+            return step(self.target)
+        finally:
+            self.replaying = False
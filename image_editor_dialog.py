@@ -1,13 +1,29 @@
+import os
+
 import cv2
 import numpy as np
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QFileDialog, QMessageBox, QSlider
+    QLabel, QPushButton, QFileDialog, QMessageBox, QSlider, QCheckBox,
+    QSpinBox, QWidget
 )
 from PyQt5.QtGui import QPixmap, QPainter, QColor
-from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtCore import Qt, QRect, QTimer
+
+from image_utils import (
+    numpy_bgr_to_qimage, numpy_gray_to_qimage, numpy_bgra_to_qimage,
+    extract_canny_edges, edge_distance_map, colorize_edge_distance
+)
+from batch_import import BatchEdgeImporter
+from memory_manager import get_memory_manager
+from render_quality import RenderQualityPolicy, FAST
+from thumbnail_strip import ThumbnailStrip
+from vector_tile import edges_to_polylines, draw_polylines_bgra
+from video_source import VideoFrameSource, FramePrefetcher
 
-from image_utils import numpy_bgr_to_qimage, numpy_gray_to_qimage, numpy_bgra_to_qimage
+
+# 동영상 스트립에서 보이는 마지막 썸네일 뒤로 미리 만들어 둘 썸네일 개수
+VIDEO_LOOKAHEAD = 24
 
 
 class SelectableLabel(QLabel):
@@ -75,9 +91,13 @@ class ImageEditorDialog(QDialog):
     """
     이미지 편집 윈도우
     - 이미지 파일 불러오기
+    - 여러 이미지 한 번에 불러오기 - 병렬로 외곽선 추출 후 썸네일 스트립에서 선택
+    - 동영상 파일 불러오기 - 외곽선 썸네일 스트립에서 프레임 선택
     - canny 외곽선
     - 외곽선 색상 선택 - 슬라이더 사용
-    - 드래그로 선택한 영역만 잘라서 메인 캔버스로 보내기
+    - 선 두께 / 부드러움 - 추출할 때 한 번 계산한 거리 맵으로 Canny 재실행 없이 조절
+    - 벡터 모드: 외곽선을 단순화된 폴리라인으로 변환해서 보냄 (허용 오차 슬라이더)
+    - 드래그로 선택한 영역만 잘라서 메인 캔버스로 보내기 (여러 개 담아서 한 번에 보내기 가능)
     """
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -86,9 +106,41 @@ class ImageEditorDialog(QDialog):
         self.resize(800, 600)
 
         self.original_img = None   # BGR (numpy)
+        self.original_loader = None  # 원본을 다시 읽는 함수 (메모리 예산 초과로 버렸을 때 사용)
         self.edges = None          # GRAY (numpy)
-        self.colored_edge_rgba = None  # BGRA (numpy)
-        self.result_qimage = None  # 메인 윈도우로 넘길 최종 QImage
+        self.edge_distance = None  # 외곽선까지의 거리 맵 (float32, 추출할 때 한 번 계산 - 버려지면 다시 계산)
+        self.edges_proxy = None    # 슬라이더 조작 중 미리보기용 저해상도 외곽선
+        self.edges_proxy_size = None
+        self.distance_proxy = None # 저해상도 외곽선의 거리 맵 (원본 픽셀 단위)
+
+        # 원본 / 거리 맵 / 프록시 / 표시용 이미지는 다시 만들 수 있으므로
+        # 메모리 예산을 넘으면 관리자가 버리고, 필요할 때 다시 만듦
+        self.memory = get_memory_manager()
+
+        # 메인 윈도우로 넘길 타일 목록: (종류, 데이터, (R, G, B), (선 두께, 부드러움))
+        # - "edges": 잘라낸 외곽선 (GRAY numpy)
+        # - "vector": (points, starts, (w, h)) 단순화된 폴리라인
+        self.results = []
+
+        # 슬라이더 조작 중에는 프록시로 빠르게, 멈추면 원본으로 한 번 다시 그림
+        self.render_policy = RenderQualityPolicy(parent=self)
+        self.render_policy.idle.connect(self.apply_color_to_edges)
+
+        # 여러 이미지 모드
+        self.batch_importer = None  # 병렬 외곽선 추출 작업
+        self.batch_items = []       # 공유 메모리로 받은 외곽선 (SharedEdges)
+        self.batch_timer = QTimer(self)
+        self.batch_timer.setInterval(50)
+
+        # 동영상 모드
+        self.video_source = None   # 선택한 프레임을 원본 해상도로 읽기 위한 소스
+        self.video_prefetcher = None  # 썸네일을 미리 만드는 작업 스레드
+        self.video_timer = QTimer(self)
+        self.video_timer.setInterval(50)
+        # 시간 슬라이더 변경(드래그 / 클릭 / 키보드)이 멈추면 썸네일 작업을 한 번만 다시 시작
+        self.video_seek_timer = QTimer(self)
+        self.video_seek_timer.setSingleShot(True)
+        self.video_seek_timer.setInterval(250)
 
         main_layout = QVBoxLayout()
 
@@ -103,20 +155,64 @@ class ImageEditorDialog(QDialog):
         # 버튼 영역
         btn_layout = QHBoxLayout()
         self.btn_load = QPushButton("이미지 열기")
+        self.btn_load_many = QPushButton("여러 이미지 열기")
+        self.btn_load_video = QPushButton("동영상 열기")
         self.btn_extract = QPushButton("외곽선 추출 (Canny)")
+        self.btn_collect = QPushButton("타일 담기")
         self.btn_send = QPushButton("메인 캔버스로 보내기")
         self.btn_close = QPushButton("닫기")
+        self.label_collected = QLabel()
+        self.update_collected_label()
 
         self.btn_extract.setEnabled(False)
+        self.btn_collect.setEnabled(False)
         self.btn_send.setEnabled(False)
 
         btn_layout.addWidget(self.btn_load)
+        btn_layout.addWidget(self.btn_load_many)
+        btn_layout.addWidget(self.btn_load_video)
         btn_layout.addWidget(self.btn_extract)
+        btn_layout.addWidget(self.btn_collect)
         btn_layout.addWidget(self.btn_send)
+        btn_layout.addWidget(self.label_collected)
         btn_layout.addWidget(self.btn_close)
 
         main_layout.addLayout(btn_layout)
 
+        # 여러 이미지 썸네일 스트립
+        self.batch_strip = ThumbnailStrip()
+        self.batch_strip.setVisible(False)
+        main_layout.addWidget(self.batch_strip)
+
+        # 동영상 영역 - 시간 이동 / 샘플링 간격 / 외곽선 썸네일 스트립
+        self.video_panel = QWidget()
+        video_layout = QVBoxLayout()
+        video_layout.setContentsMargins(0, 0, 0, 0)
+
+        video_ctrl_layout = QHBoxLayout()
+        self.slider_video_time = QSlider(Qt.Horizontal)
+        self.slider_video_time.setRange(0, 0)
+        self.label_video_time = QLabel("0.0s")
+        self.spin_video_stride = QSpinBox()
+        self.spin_video_stride.setRange(1, 3600)
+        self.spin_video_stride.setValue(30)
+        self.chk_keyframes = QCheckBox("키프레임만")
+
+        video_ctrl_layout.addWidget(QLabel("시간"))
+        video_ctrl_layout.addWidget(self.slider_video_time, stretch=1)
+        video_ctrl_layout.addWidget(self.label_video_time)
+        video_ctrl_layout.addWidget(QLabel("프레임 간격"))
+        video_ctrl_layout.addWidget(self.spin_video_stride)
+        video_ctrl_layout.addWidget(self.chk_keyframes)
+        video_layout.addLayout(video_ctrl_layout)
+
+        self.video_strip = ThumbnailStrip()
+        video_layout.addWidget(self.video_strip)
+
+        self.video_panel.setLayout(video_layout)
+        self.video_panel.setVisible(False)
+        main_layout.addWidget(self.video_panel)
+
         # 색상 슬라이더 (R, G, B)
         slider_layout = QHBoxLayout()
         self.slider_r = QSlider(Qt.Horizontal)
@@ -141,11 +237,55 @@ class ImageEditorDialog(QDialog):
 
         main_layout.addLayout(slider_layout)
 
+        # 선 두께 (슬라이더 값 * 0.5 픽셀) / 부드러움 (슬라이더 값 * 0.5 픽셀)
+        style_layout = QHBoxLayout()
+        self.slider_thickness = QSlider(Qt.Horizontal)
+        self.slider_thickness.setRange(2, 30)
+        self.slider_thickness.setValue(2)
+        self.slider_softness = QSlider(Qt.Horizontal)
+        self.slider_softness.setRange(0, 8)
+        self.slider_softness.setValue(0)
+        self.label_style = QLabel()
+        self.update_style_label()
+
+        for s in (self.slider_thickness, self.slider_softness):
+            s.setEnabled(False)
+
+        style_layout.addWidget(QLabel("선 두께"))
+        style_layout.addWidget(self.slider_thickness)
+        style_layout.addWidget(QLabel("부드럽게"))
+        style_layout.addWidget(self.slider_softness)
+        style_layout.addWidget(self.label_style)
+
+        main_layout.addLayout(style_layout)
+
+        # 벡터 모드 (폴리라인 단순화 허용 오차: 슬라이더 값 * 0.5 픽셀)
+        vector_layout = QHBoxLayout()
+        self.chk_vector = QCheckBox("벡터 모드")
+        self.slider_tolerance = QSlider(Qt.Horizontal)
+        self.slider_tolerance.setRange(0, 20)
+        self.slider_tolerance.setValue(2)
+        self.label_tolerance = QLabel()
+        self.update_tolerance_label()
+
+        self.chk_vector.setEnabled(False)
+        self.slider_tolerance.setEnabled(False)
+
+        vector_layout.addWidget(self.chk_vector)
+        vector_layout.addWidget(QLabel("허용 오차"))
+        vector_layout.addWidget(self.slider_tolerance)
+        vector_layout.addWidget(self.label_tolerance)
+
+        main_layout.addLayout(vector_layout)
+
         self.setLayout(main_layout)
 
         # 연결
         self.btn_load.clicked.connect(self.on_load_image)
+        self.btn_load_many.clicked.connect(self.on_load_many_images)
+        self.btn_load_video.clicked.connect(self.on_load_video)
         self.btn_extract.clicked.connect(self.on_extract_edges)
+        self.btn_collect.clicked.connect(self.on_collect_tile)
         self.btn_send.clicked.connect(self.on_send_to_main)
         self.btn_close.clicked.connect(self.reject)
 
@@ -153,16 +293,38 @@ class ImageEditorDialog(QDialog):
         self.slider_g.valueChanged.connect(self.on_color_changed)
         self.slider_b.valueChanged.connect(self.on_color_changed)
 
+        self.chk_vector.toggled.connect(self.on_vector_mode_changed)
+        self.slider_tolerance.valueChanged.connect(self.on_tolerance_changed)
+        self.slider_thickness.valueChanged.connect(self.on_style_changed)
+        self.slider_softness.valueChanged.connect(self.on_style_changed)
+
+        self.batch_timer.timeout.connect(self.on_batch_poll)
+        self.batch_strip.clicked.connect(self.on_batch_thumbnail_clicked)
+
+        self.video_timer.timeout.connect(self.on_video_poll)
+        self.video_seek_timer.timeout.connect(self.restart_video_prefetch)
+        self.video_strip.horizontalScrollBar().valueChanged.connect(self.allow_video_prefetch)
+        self.slider_video_time.valueChanged.connect(self.on_video_time_changed)
+        self.spin_video_stride.valueChanged.connect(self.restart_video_prefetch)
+        self.chk_keyframes.toggled.connect(self.restart_video_prefetch)
+        self.video_strip.clicked.connect(self.on_video_thumbnail_clicked)
+
     # 이미지 표시 관련
 
-    def set_image_to_label(self, qimg):
+    def set_image_to_label(self, qimg, source_size=None):
         """
         QImage를 QPixmap으로 변환, 라벨 크기에 맞게 출력
+        - source_size: qimg가 저해상도 프록시일 때 원본 크기 (w, h)
+          선택 영역 좌표 변환은 항상 원본 기준으로 저장
+        - 상호작용 중(빠른 모드)에는 Fast 보간으로 확대/축소
         """
         label_w = self.image_label.width()
         label_h = self.image_label.height()
-        img_w = qimg.width()
-        img_h = qimg.height()
+        if source_size is None:
+            img_w = qimg.width()
+            img_h = qimg.height()
+        else:
+            img_w, img_h = source_size
 
         if img_w == 0 or img_h == 0:
             return
@@ -178,7 +340,7 @@ class ImageEditorDialog(QDialog):
             disp_w,
             disp_h,
             Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
+            self.render_policy.transformation_mode()
         )
         self.image_label.setPixmap(pix)
         self.image_label.setAlignment(Qt.AlignCenter)
@@ -211,19 +373,311 @@ class ImageEditorDialog(QDialog):
             QMessageBox.warning(self, "오류", "이미지를 불러올 수 없습니다.")
             return
 
+        self.close_video()
+        self.close_batch()
+        self.set_original_image(img, loader=lambda: cv2.imread(file_path))
+
+    def set_original_image(self, img, loader=None):
+        """
+        원본(BGR) 이미지를 바꾸고 이전 추출 결과를 초기화한 뒤 표시
+        - loader가 있으면 메모리가 부족할 때 원본을 버렸다가 필요할 때 다시 읽음
+        """
+        self.release_editor_memory()
         self.original_img = img
-        self.edges = None
-        self.colored_edge_rgba = None
-        self.result_qimage = None
+        self.original_loader = loader
+        self.memory.track(
+            self, "original", "editor_original", img.nbytes,
+            self.evict_original if loader is not None else None
+        )
 
         qimg = numpy_bgr_to_qimage(img)
         self.set_image_to_label(qimg)
 
         self.btn_extract.setEnabled(True)
-        self.btn_send.setEnabled(False)
+        self.btn_collect.setEnabled(False)
+        # 이미 담아 둔 타일은 새 이미지를 열어도 보낼 수 있음
+        self.update_collected_label()
 
-        for s in (self.slider_r, self.slider_g, self.slider_b):
+        for s in (self.slider_r, self.slider_g, self.slider_b,
+                  self.slider_thickness, self.slider_softness):
             s.setEnabled(False)
+        self.chk_vector.setEnabled(False)
+        self.slider_tolerance.setEnabled(False)
+
+    # 여러 이미지 선택
+
+    def on_load_many_images(self):
+        """
+        여러 이미지를 선택해서 작업 프로세스 풀에서 병렬로 축소 디코딩 + 외곽선 추출
+        - 결과는 공유 메모리로 복사 없이 받아서 썸네일 스트립에 채움
+        """
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "이미지 여러 장 선택",
+            "",
+            "Images (*.png *.jpg *.jpeg *.bmp)"
+        )
+        if not file_paths:
+            return
+
+        self.close_video()
+        self.close_batch()
+
+        self.batch_importer = BatchEdgeImporter(file_paths)
+        self.batch_strip.setVisible(True)
+        self.image_label.setText("아래 썸네일에서 이미지를 선택하세요.")
+        self.batch_timer.start()
+
+    def on_batch_poll(self):
+        """
+        끝난 추출 결과를 스트립에 추가 (GUI 스레드에서 주기적으로 호출)
+        """
+        importer = self.batch_importer
+        if importer is None:
+            self.batch_timer.stop()
+            return
+
+        for shared in importer.poll():
+            self.batch_strip.strip_model.append(
+                os.path.basename(shared.path), shared.edges, len(self.batch_items)
+            )
+            self.batch_items.append(shared)
+            self.memory.track(shared, "edges", "editor_batch", shared.edges.nbytes)
+
+        if importer.is_done():
+            self.batch_timer.stop()
+            if importer.failed:
+                QMessageBox.warning(
+                    self, "오류",
+                    f"{len(importer.failed)}개의 이미지를 불러올 수 없습니다."
+                )
+
+    def on_batch_thumbnail_clicked(self, index):
+        """
+        썸네일 선택 - 이미 추출된 외곽선을 바로 표시 (다시 추출하지 않음)
+        """
+        item = self.batch_strip.strip_model.user_data(index.row())
+        self.release_editor_memory()
+        self.btn_extract.setEnabled(False)
+        # 공유 메모리 외곽선은 스트립 쪽에서 이미 기록 중
+        self.set_edges(self.batch_items[item].edges, tracked=False)
+
+    def close_batch(self):
+        """
+        병렬 작업을 정리하고 공유 메모리를 반환
+        - 공유 메모리를 가리키는 배열을 먼저 모두 놓아야 닫을 수 있음
+        """
+        self.batch_timer.stop()
+        if self.batch_importer is not None:
+            self.batch_importer.shutdown()
+            self.batch_importer = None
+
+        if self.batch_items:
+            self.batch_strip.strip_model.clear()
+            self.release_editor_memory()
+            for shared in self.batch_items:
+                shared.release()
+                self.memory.release(shared)
+            self.batch_items = []
+        self.batch_strip.setVisible(False)
+
+    # 동영상 선택
+
+    def on_load_video(self):
+        """
+        동영상을 열고 작업 스레드에서 외곽선 썸네일을 차례로 만들어 스트립에 채움
+        - 전체 동영상을 디코딩하지 않고, 썸네일로 고른 프레임만 원본 해상도로 읽음
+        """
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "동영상 선택",
+            "",
+            "Videos (*.mp4 *.mov *.avi *.mkv *.webm)"
+        )
+        if not file_path:
+            return
+
+        self.close_video()
+        self.close_batch()
+        try:
+            self.video_source = VideoFrameSource(file_path)
+        except IOError:
+            QMessageBox.warning(self, "오류", "동영상을 불러올 수 없습니다.")
+            return
+
+        duration_ds = int(self.video_source.duration * 10)
+        self.slider_video_time.blockSignals(True)
+        self.slider_video_time.setRange(0, max(0, duration_ds))
+        self.slider_video_time.setValue(0)
+        self.slider_video_time.blockSignals(False)
+        self.on_video_time_changed(0)
+
+        self.spin_video_stride.blockSignals(True)
+        self.spin_video_stride.setValue(max(1, int(round(self.video_source.fps))))
+        self.spin_video_stride.blockSignals(False)
+
+        self.video_panel.setVisible(True)
+        self.image_label.setText("아래 썸네일에서 프레임을 선택하세요.")
+        self.restart_video_prefetch()
+
+    def restart_video_prefetch(self, *args):
+        """
+        현재 시간 / 간격 / 키프레임 설정으로 썸네일 작업 스레드를 다시 시작
+        """
+        if self.video_source is None:
+            return
+
+        self.stop_video_prefetch()
+        self.video_strip.strip_model.clear()
+
+        self.video_prefetcher = FramePrefetcher(
+            self.video_source.path,
+            start=self.slider_video_time.value() / 10,
+            stride=self.spin_video_stride.value(),
+            keyframes_only=self.chk_keyframes.isChecked(),
+            lookahead=VIDEO_LOOKAHEAD,
+        )
+        self.video_prefetcher.start_worker()
+        self.video_timer.start()
+
+    def on_video_poll(self):
+        """
+        작업 스레드가 만든 썸네일을 스트립에 추가 (GUI 스레드에서 주기적으로 호출)
+        """
+        prefetcher = self.video_prefetcher
+        if prefetcher is None:
+            self.video_timer.stop()
+            return
+
+        for index, t, edge_thumb in prefetcher.drain(max_items=16):
+            self.video_strip.strip_model.append(f"{t:.1f}s", edge_thumb, index)
+        self.allow_video_prefetch()
+
+        if prefetcher.is_done():
+            self.video_timer.stop()
+
+    def allow_video_prefetch(self, *args):
+        """
+        스트립에 보이는 마지막 썸네일 뒤로 VIDEO_LOOKAHEAD개까지만 작업 스레드가 만들도록 허용
+        - 스크롤하면 더 허용해서 이어서 만듦 (보지 않는 뒤쪽은 디코딩하지 않음)
+        """
+        if self.video_prefetcher is not None:
+            self.video_prefetcher.allow(
+                self.video_strip.last_visible_row() + 1 + VIDEO_LOOKAHEAD
+            )
+
+    def on_video_time_changed(self, value):
+        self.label_video_time.setText(f"{value / 10:.1f}s")
+        self.video_seek_timer.start()
+
+    def on_video_thumbnail_clicked(self, index):
+        """
+        썸네일 선택 - 해당 프레임 하나만 원본 해상도로 디코딩해서 외곽선 추출
+        """
+        if self.video_source is None:
+            return
+
+        frame_index = self.video_strip.strip_model.user_data(index.row())
+        source = self.video_source
+        frame = source.read_frame(frame_index)
+        if frame is None:
+            QMessageBox.warning(self, "오류", "프레임을 읽을 수 없습니다.")
+            return
+
+        self.set_original_image(frame, loader=lambda: source.read_frame(frame_index))
+        self.on_extract_edges()
+
+    def stop_video_prefetch(self):
+        self.video_timer.stop()
+        self.video_seek_timer.stop()
+        if self.video_prefetcher is not None:
+            self.video_prefetcher.stop()
+            self.video_prefetcher = None
+
+    def close_video(self):
+        """
+        동영상 작업 스레드와 소스를 정리하고 동영상 영역을 숨김
+        - 지금 보이는 프레임은 닫힌 소스에서 다시 읽을 수 없으므로 함께 놓고 추출 버튼을 끔
+        """
+        self.stop_video_prefetch()
+        if self.video_source is not None:
+            self.video_source.close()
+            self.video_source = None
+
+            self.release_editor_memory()
+            self.image_label.clear()
+            self.image_label.selection_rect = None
+            self.image_label.setText("이미지를 불러오세요.")
+            self.btn_extract.setEnabled(False)
+            self.btn_collect.setEnabled(False)
+            self.update_collected_label()
+        self.video_strip.strip_model.clear()
+        self.video_panel.setVisible(False)
+
+    def done(self, result):
+        """
+        다이얼로그가 닫힐 때 (accept / reject 모두) 동영상 / 여러 이미지 작업 정리
+        - 보낼 결과(self.results) 외의 큰 배열은 모두 놓음
+        """
+        self.close_video()
+        self.close_batch()
+        self.release_editor_memory()
+        super().done(result)
+
+    # 메모리 관리
+
+    def release_editor_memory(self):
+        """
+        원본 / 외곽선 / 거리 맵 / 프록시를 놓고 메모리 기록도 지움
+        """
+        self.original_img = None
+        self.original_loader = None
+        self.edges = None
+        self.edge_distance = None
+        self.edges_proxy = None
+        self.edges_proxy_size = None
+        self.distance_proxy = None
+        self.memory.release(self)
+
+    def current_original(self):
+        """
+        원본(BGR) 이미지 - 메모리 예산 초과로 버려졌으면 다시 읽음
+        """
+        if self.original_img is None and self.original_loader is not None:
+            img = self.original_loader()
+            if img is not None:
+                self.original_img = img
+                self.memory.track(
+                    self, "original", "editor_original", img.nbytes, self.evict_original
+                )
+        else:
+            self.memory.touch(self, "original")
+        return self.original_img
+
+    def full_distance(self):
+        """
+        원본 해상도 거리 맵 - 버려졌으면 다시 계산
+        """
+        if self.edge_distance is None:
+            self.edge_distance = edge_distance_map(self.edges)
+            self.memory.track(
+                self, "distance", "editor_distance",
+                self.edge_distance.nbytes, self.evict_distance
+            )
+        else:
+            self.memory.touch(self, "distance")
+        return self.edge_distance
+
+    def evict_original(self):
+        self.original_img = None
+
+    def evict_distance(self):
+        self.edge_distance = None
+
+    def evict_proxy(self):
+        self.edges_proxy = None
+        self.edges_proxy_size = None
+        self.distance_proxy = None
 
     # canny 외곽선 추출
 
@@ -231,50 +685,124 @@ class ImageEditorDialog(QDialog):
         """
         canny 외곽선 추출 후 결과를 그레이스케일 기반으로 표시 / 색상 슬라이더 활성화
         """
-        if self.original_img is None:
+        original = self.current_original()
+        if original is None:
             QMessageBox.information(self, "알림", "먼저 이미지를 불러오세요.")
             return
 
-        gray = cv2.cvtColor(self.original_img, cv2.COLOR_BGR2GRAY)
-        gray = cv2.GaussianBlur(gray, (5, 5), 0)
-
         # canny 외곽선 검출하기
-        self.edges = cv2.Canny(gray, 100, 200)
+        self.set_edges(extract_canny_edges(original))
+
+    def set_edges(self, edges, tracked=True):
+        """
+        추출된 외곽선을 현재 편집 대상으로 설정하고 표시 / 색상 슬라이더 활성화
+        - 두께 조절용 거리 맵은 여기서 한 번만 계산
+        - tracked=False면 외곽선 자체는 메모리 사용량에 따로 기록하지 않음 (이미 기록된 배열)
+        """
+        self.edges = edges
+        self.edge_distance = None
+        self.evict_proxy()
+        self.memory.release(self, "proxy")
+        if tracked:
+            self.memory.track(self, "edges", "editor_edges", edges.nbytes)
+        else:
+            self.memory.release(self, "edges")
+        self.full_distance()
 
         # 초기 색상(슬라이더 값)에 맞춰 한 번 칠해서 표시
         self.apply_color_to_edges()
 
-        self.btn_send.setEnabled(True)
-        for s in (self.slider_r, self.slider_g, self.slider_b):
+        self.btn_collect.setEnabled(True)
+        self.update_collected_label()
+        for s in (self.slider_r, self.slider_g, self.slider_b,
+                  self.slider_thickness, self.slider_softness):
             s.setEnabled(True)
+        self.chk_vector.setEnabled(True)
+        self.slider_tolerance.setEnabled(self.chk_vector.isChecked())
 
     def apply_color_to_edges(self):
         """
-        self.edges(0/255)와 슬라이더의 R,G,B 값으로
+        거리 맵과 슬라이더의 R,G,B / 선 두께 / 부드러움 값으로
         BGRA 이미지 생성 후 라벨에 표시
+        - 벡터 모드에서는 단순화된 폴리라인을 그려서 결과를 미리 보여줌
+        - 슬라이더 조작 중(빠른 모드)에는 저해상도 프록시만 칠함
         """
         if self.edges is None:
             return
 
-        h, w = self.edges.shape
-        bgra = np.zeros((h, w, 4), dtype=np.uint8)
+        mode = self.render_policy.mode
+        src_h, src_w = self.edges.shape
+        if mode == FAST:
+            edges = self.proxy_edges()
+            dist = self.distance_proxy
+        else:
+            edges = self.edges
+            dist = self.full_distance()
+
+        h, w = edges.shape
+        color = (self.slider_r.value(), self.slider_g.value(), self.slider_b.value())
+        thickness, softness = self.edge_style()
+
+        if self.chk_vector.isChecked():
+            bgra = np.zeros((h, w, 4), dtype=np.uint8)
+            tolerance = self.vector_tolerance() * w / src_w
+            points, starts = edges_to_polylines(edges, tolerance)
+            draw_polylines_bgra(bgra, points, starts, color, thickness * w / src_w)
+        else:
+            bgra = colorize_edge_distance(dist, color, thickness, softness)
 
-        mask = self.edges != 0
-        r = self.slider_r.value()
-        g = self.slider_g.value()
-        b = self.slider_b.value()
+        qimg = numpy_bgra_to_qimage(bgra)
+        self.set_image_to_label(qimg, (src_w, src_h))
+        self.render_policy.report_frame(mode)
 
-        bgra[mask, 0] = b
-        bgra[mask, 1] = g
-        bgra[mask, 2] = r
-        bgra[mask, 3] = 255
+    def proxy_edges(self):
+        """
+        빠른 모드용 저해상도 외곽선 (라벨에 표시될 크기 * proxy_scale)
+        - 얇은 선이 사라지지 않도록 INTER_AREA로 줄인 뒤 0보다 큰 곳은 모두 외곽선으로 봄
+        - 프록시의 거리 맵도 함께 계산해 distance_proxy에 둠 (원본 픽셀 단위로 환산)
+        """
+        h, w = self.edges.shape
+        scale = min(
+            1.0,
+            self.image_label.width() / w,
+            self.image_label.height() / h
+        ) * self.render_policy.proxy_scale
+        size = (max(1, int(w * scale)), max(1, int(h * scale)))
+
+        if self.edges_proxy is None or self.edges_proxy_size != size:
+            small = cv2.resize(self.edges, size, interpolation=cv2.INTER_AREA)
+            self.edges_proxy = np.where(small > 0, 255, 0).astype(np.uint8)
+            self.edges_proxy_size = size
+            self.distance_proxy = edge_distance_map(self.edges_proxy) * (w / size[0])
+            self.memory.track(
+                self, "proxy", "editor_proxy",
+                self.edges_proxy.nbytes + self.distance_proxy.nbytes, self.evict_proxy
+            )
+        else:
+            self.memory.touch(self, "proxy")
+        return self.edges_proxy
+
+    # 선 두께 / 부드러움
+
+    def edge_style(self):
+        """
+        (선 두께, 부드러움) - 픽셀 단위
+        """
+        return self.slider_thickness.value() * 0.5, self.slider_softness.value() * 0.5
 
-        self.colored_edge_rgba = bgra
-        qimg = numpy_bgra_to_qimage(bgra)
-        self.set_image_to_label(qimg)
+    def update_style_label(self):
+        thickness, softness = self.edge_style()
+        self.label_style.setText(f"{thickness:.1f}px / {softness:.1f}px")
 
-        # 메인으로 보낼 기본 결과(선택 안 했을 때 대비)
-        self.result_qimage = qimg
+    def on_style_changed(self, value):
+        """
+        선 두께 / 부드러움 변경 - 캐시된 거리 맵으로 알파만 다시 계산
+        """
+        self.update_style_label()
+        if self.edges is None:
+            return
+        self.render_policy.interact()
+        self.apply_color_to_edges()
 
     def on_color_changed(self, value):
         """
@@ -282,8 +810,36 @@ class ImageEditorDialog(QDialog):
         """
         if self.edges is None:
             return
+        self.render_policy.interact()
+        self.apply_color_to_edges()
+
+    # 벡터 모드
+
+    def vector_tolerance(self):
+        """
+        approxPolyDP 허용 오차 (픽셀)
+        """
+        return self.slider_tolerance.value() * 0.5
+
+    def update_tolerance_label(self):
+        self.label_tolerance.setText(f"{self.vector_tolerance():.1f}px")
+
+    def on_vector_mode_changed(self, checked):
+        """
+        벡터 모드 전환 - 허용 오차 슬라이더 활성화 후 미리보기 갱신
+        """
+        self.slider_tolerance.setEnabled(checked and self.edges is not None)
         self.apply_color_to_edges()
 
+    def on_tolerance_changed(self, value):
+        """
+        허용 오차 변경 시 폴리라인 미리보기 갱신
+        """
+        self.update_tolerance_label()
+        if self.chk_vector.isChecked():
+            self.render_policy.interact()
+            self.apply_color_to_edges()
+
     # 선택 영역 잘라내기
 
     def crop_edges_by_selection(self):
@@ -331,33 +887,68 @@ class ImageEditorDialog(QDialog):
 
     # 메인 캔버스로 보내기
 
-    def on_send_to_main(self):
+    def collect_selection(self):
         """
         드래그로 선택한 영역만 잘라서 (없으면 전체)
-        색상 슬라이더 기준의 R,G,B로 칠한
-        투명 배경 RGBA QImage를 만들어 result_qimage에 담아 accept()
+        잘라낸 외곽선과 색상 슬라이더 기준의 R,G,B를 results에 추가
+        - 실제 RGBA 타일은 메인 윈도우의 타일 레지스트리가 만들고 공유함
+        - 벡터 모드에서는 픽셀 대신 폴리라인을 담음
+        - 성공하면 True
         """
         if self.edges is None:
             QMessageBox.information(self, "알림", "먼저 외곽선을 추출해주세요.")
-            return
+            return False
 
         cropped_edges = self.crop_edges_by_selection()
         if cropped_edges is None:
             QMessageBox.warning(self, "오류", "잘라낼 수 있는 영역이 없습니다.")
-            return
+            return False
 
-        h, w = cropped_edges.shape
-        bgra = np.zeros((h, w, 4), dtype=np.uint8)
+        color = (
+            self.slider_r.value(),
+            self.slider_g.value(),
+            self.slider_b.value(),
+        )
 
-        mask = cropped_edges != 0
-        r = self.slider_r.value()
-        g = self.slider_g.value()
-        b = self.slider_b.value()
+        if self.chk_vector.isChecked():
+            h, w = cropped_edges.shape
+            points, starts = edges_to_polylines(
+                np.ascontiguousarray(cropped_edges), self.vector_tolerance()
+            )
+            self.results.append(
+                ("vector", (points, starts, (w, h)), color, self.edge_style())
+            )
+        else:
+            # 여러 이미지 모드에서는 공유 메모리의 view일 수 있으므로 복사해서 담음
+            self.results.append(
+                ("edges", np.array(cropped_edges), color, self.edge_style())
+            )
+
+        self.update_collected_label()
+        return True
+
+    def update_collected_label(self):
+        self.label_collected.setText(f"담은 타일: {len(self.results)}")
+        # 담은 타일이 있거나 지금 외곽선이 있으면 보낼 수 있음
+        self.btn_send.setEnabled(bool(self.results) or self.edges is not None)
+
+    def on_collect_tile(self):
+        """
+        현재 선택 영역을 타일로 담고 창은 그대로 유지 (다음 영역 / 이미지 선택 가능)
+        """
+        if self.collect_selection():
+            self.image_label.selection_rect = None
+            self.image_label.update()
 
-        bgra[mask, 0] = b
-        bgra[mask, 1] = g
-        bgra[mask, 2] = r
-        bgra[mask, 3] = 255
+    def on_send_to_main(self):
+        """
+        지금까지 담은 타일을 모두 메인 캔버스로 보냄 - accept()
+        - 새로 드래그한 영역이 있거나 아직 담은 타일이 없으면 현재 외곽선(선택 영역)도 담아서 보냄
+        - 담은 타일이 있고 새 선택이 없으면 담은 것만 보냄 (현재 외곽선 전체를 덧붙이지 않음)
+        """
+        if self.results and self.image_label.selection_rect is None:
+            self.accept()
+            return
 
-        self.result_qimage = numpy_bgra_to_qimage(bgra)
-        self.accept()
\ No newline at end of file
+        if self.collect_selection():
+            self.accept()
\ No newline at end of file
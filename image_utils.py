@@ -44,3 +44,59 @@ def numpy_bgra_to_qimage(img_bgra: np.ndarray) -> QImage:
     return QImage(
         img_rgba.data, w, h, bytes_per_line, QImage.Format_RGBA8888
     ).copy()
+
+
+"""
+BGR 이미지에서 canny 외곽선 추출
+- 그레이스케일 -> 5x5 가우시안 블러 -> Canny(100, 200)
+"""
+def extract_canny_edges(img_bgr: np.ndarray) -> np.ndarray:
+
+    gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
+    gray = cv2.GaussianBlur(gray, (5, 5), 0)
+    return cv2.Canny(gray, 100, 200)
+
+
+"""
+외곽선(0/255)까지의 거리 맵 (float32, 픽셀 단위)
+- 외곽선 픽셀은 0, 멀어질수록 커짐
+- 추출할 때 한 번만 계산해 두면 두께 변경은 이 맵에 대한 임계값 계산만으로 끝남
+"""
+def edge_distance_map(edges: np.ndarray) -> np.ndarray:
+
+    background = np.where(edges != 0, 0, 255).astype(np.uint8)
+    return cv2.distanceTransform(background, cv2.DIST_L2, cv2.DIST_MASK_PRECISE)
+
+
+"""
+거리 맵에서 선 두께 / 부드러움에 따른 알파(0~255, uint8) 계산
+- 픽셀 면적 중 선(중심에서 thickness/2 이내)이 덮는 비율을 알파로 씀
+  (경계 1px 구간을 선형으로 - 0.5px 단위 두께 변화가 옆 픽셀의 옅기로 드러남)
+- softness > 0 이면 그 경계 구간을 (1 + softness) 픽셀로 넓혀 바깥쪽으로 더 부드럽게 옅어지게 함
+  (선 안쪽은 softness 0일 때보다 옅어지지 않음)
+- thickness=1, softness=0 은 원래의 1px 외곽선과 같음
+"""
+def edge_alpha_from_distance(dist: np.ndarray, thickness: float, softness: float) -> np.ndarray:
+
+    half = thickness / 2
+    alpha = (half + 0.5 - dist) * 255.0
+    if softness > 0:
+        ramp = 1.0 + softness
+        np.maximum(alpha, (half + ramp / 2 - dist) * (255.0 / ramp), out=alpha)
+    np.clip(alpha, 0, 255, out=alpha)
+    return np.rint(alpha).astype(np.uint8)
+
+
+"""
+거리 맵과 색상으로 투명 배경 BGRA 외곽선 이미지 생성
+"""
+def colorize_edge_distance(dist: np.ndarray, color_rgb, thickness: float, softness: float) -> np.ndarray:
+
+    h, w = dist.shape
+    r, g, b = color_rgb
+    bgra = np.empty((h, w, 4), dtype=np.uint8)
+    bgra[:, :, 0] = b
+    bgra[:, :, 1] = g
+    bgra[:, :, 2] = r
+    bgra[:, :, 3] = edge_alpha_from_distance(dist, thickness, softness)
+    return bgra
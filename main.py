@@ -1,13 +1,36 @@
 import sys
-from PyQt5.QtWidgets import QApplication
-from main_window import MainWindow
+import time
+
+# 시작 시간 측정 기준 (다른 import 보다 먼저)
+START_TIME = time.perf_counter()
+
+from startup import StartupProfiler, warm_up_in_background
 
 def main():
 
-    app = QApplication(sys.argv)
-    win = MainWindow()
+    # --profile-startup: import / 첫 화면 그리기까지의 시간을 stderr로 출력
+    profile = "--profile-startup" in sys.argv
+    if profile:
+        sys.argv.remove("--profile-startup")
+    profiler = StartupProfiler(START_TIME, enabled=profile)
+
+    with profiler.measure("import PyQt5.QtWidgets"):
+        from PyQt5.QtWidgets import QApplication
+    with profiler.measure("import main_window"):
+        from main_window import MainWindow
+
+    with profiler.measure("QApplication()"):
+        app = QApplication(sys.argv)
+    with profiler.measure("MainWindow()"):
+        win = MainWindow()
+
+    # 창이 처음 그려진 뒤에 OpenCV / NumPy / 편집 창을 백그라운드에서 미리 import
+    profiler.watch_first_paint(
+        win,
+        on_painted=lambda: warm_up_in_background(on_done=profiler.report_warm_up)
+    )
     win.show()
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
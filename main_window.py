@@ -1,24 +1,39 @@
+import math
+
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QLabel, QPushButton,
-    QVBoxLayout, QHBoxLayout, QMessageBox, QSlider, QFileDialog
+    QVBoxLayout, QHBoxLayout, QMessageBox, QSlider, QFileDialog, QSizePolicy,
+    QShortcut, QColorDialog
+)
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QKeySequence
+from PyQt5.QtCore import Qt, QPoint, QRectF, pyqtSignal
+
+from canvas_viewport import CanvasViewport
+from history import (
+    EditHistory, MoveCommand, PlaceCommand, RemoveCommand, RetileCommand,
+    BackgroundCommand
 )
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor
-from PyQt5.QtCore import Qt, QPoint
+from memory_manager import get_memory_manager, format_bytes
+from render_quality import RenderQualityPolicy, SMOOTH
 
-from image_editor_dialog import ImageEditorDialog
+# image_editor_dialog / tile_registry / vector_tile 은 OpenCV, NumPy를 끌어오므로
+# 창을 띄울 때가 아니라 처음 쓸 때 import (main.py 에서 창이 뜬 뒤 미리 데워둠)
 
 
 class DraggableCanvasLabel(QLabel):
     """
     메인 캔버스 미리보기
-    - 마우스 이벤트를 받아서 main window 에 넘겨줌
-    - 실제 드래그 로직은 main window가 처리
+    - 마우스 / 휠 / 크기 변경 이벤트를 받아서 main window 에 넘겨줌
+    - 실제 드래그 / 확대 로직은 main window가 처리
     """
     def __init__(self, parent=None):
 
         super().__init__(parent)
         self.main_window = None
         self.setMouseTracking(True)
+        # 라벨 크기만 한 pixmap을 넣기 때문에 pixmap 크기가 창 크기를 고정하지 않게 함
+        self.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        self.setMinimumSize(1, 1)
 
     def set_main_window(self, main_window):
 
@@ -39,6 +54,17 @@ class DraggableCanvasLabel(QLabel):
         if self.main_window is not None:
             self.main_window.on_canvas_mouse_release(event)
 
+    def wheelEvent(self, event):
+
+        if self.main_window is not None:
+            self.main_window.on_canvas_wheel(event)
+
+    def resizeEvent(self, event):
+
+        super().resizeEvent(event)
+        if self.main_window is not None:
+            self.main_window.update_canvas_preview()
+
 
 class MainWindow(QMainWindow):
 
@@ -48,9 +74,16 @@ class MainWindow(QMainWindow):
     - 이미지 QImage 받아오기
     - 받은 외곽선 이미지들을 캔버스에 배치
     - 배경 색 슬라이더로 배경 조절
+    - 선택한 이미지의 선 두께 / 부드러움 조절 (외곽선 재추출 없이)
     - 마우스로 이미지를 드래그해서 위치 수정
+    - 휠로 확대/축소, 빈 곳 드래그(또는 가운데/오른쪽 버튼)로 화면 이동
+    - 선택 이미지 삭제 / 색상 변경, 되돌리기(Ctrl+Z) / 다시 하기(Ctrl+Shift+Z, Ctrl+Y)
     - 최종 결과물을 이미지 파일로 저장
+    - 상태 표시줄에 메모리 사용량 / 예산 표시
     """
+    # 메모리 관리자 알림은 다른 스레드(가비지 컬렉션)에서 올 수 있어 시그널로 넘김
+    memory_changed = pyqtSignal()
+
     def __init__(self):
 
         super().__init__()
@@ -61,24 +94,42 @@ class MainWindow(QMainWindow):
         # 캔버스
         self.canvas_width = 0
         self.canvas_height = 0
-        self.current_canvas_qimage = None  # 실제로 비춰지는 해상도 캔버스
         self.image_placement_locked = False
 
         # 배치
-        # placed_images: (QImage, x, y, w, h)
+        # placed_images: (EdgeTile 또는 VectorTile, x, y, w, h)
+        # - 같은 타일은 레지스트리를 통해 하나의 픽셀 버퍼를 공유
+        self._tile_registry = None
         self.placed_images = []
+        self.selected_index = None
         self.next_x = 0
         self.next_y = 0
         self.current_row_height = 0
 
-        # 미리보기에서 캔버스 좌표로 변환하기 위한 정보
-        self.preview_scale = 1.0
-        self.preview_offset_x = 0
-        self.preview_offset_y = 0
+        # 미리보기 <-> 캔버스 좌표 변환 (확대 / 이동)
+        self.viewport = CanvasViewport()
+        self.panning = False
+        self.pan_last_pos = QPoint(0, 0)
+
+        # 드래그 / 슬라이더 조작 중에는 빠르게, 멈추면 한 번 부드럽게 다시 그림
+        self.render_policy = RenderQualityPolicy(parent=self)
+        self.render_policy.idle.connect(self.update_canvas_preview)
+        self.render_policy.frame_reported.connect(self.on_render_frame_reported)
+
+        # 마지막으로 그린 부드러운 프레임 - 되돌리기 등은 바뀐 영역만 이 위에 다시 그림
+        self.preview_frame = None
+        self.preview_view_key = None
+
+        # 되돌리기 / 다시 하기 - 변경 명령만 기록 (타일은 참조만 공유)
+        # 슬라이더 조작은 멈출 때(idle)까지 하나의 항목으로 합침
+        self.history = EditHistory(self)
+        self.bg_color = (0, 0, 0)  # 기록된 배경색 (슬라이더 변경 전 값)
+        self.render_policy.idle.connect(self.history.seal)
 
         # 드래그 중 선택된 이미지의 정보
         self.dragging_index = None
         self.drag_offset_in_image = QPoint(0, 0)  # 이미지 내부에서의 클릭 위치
+        self.drag_start_pos = None  # 드래그 시작 시 이미지 위치 (한 번의 드래그 = 기록 하나)
 
         # UI
         central_widget = QWidget()
@@ -116,22 +167,44 @@ class MainWindow(QMainWindow):
         )
         main_layout.addWidget(self.canvas_label, stretch=1)
 
-        # 하단 버튼 - 이미지 추가 / 완료 / 저장
+        # 하단 버튼 - 이미지 추가 / 복제 / 완료 / 저장
         bottom_layout = QHBoxLayout()
         self.btn_add_image = QPushButton("이미지 추가하기")
+        self.btn_duplicate = QPushButton("선택 이미지 복제")
         self.btn_finish_or_bg = QPushButton("이미지 추가 완료 -> 배경색 설정 모드로")
         self.btn_save = QPushButton("이미지 저장하기")
+        self.btn_fit_view = QPushButton("전체 보기")
+        self.label_zoom = QLabel("100%")
 
         self.btn_add_image.setEnabled(False)
+        self.btn_duplicate.setEnabled(False)
         self.btn_finish_or_bg.setEnabled(False)
         self.btn_save.setEnabled(False)
 
         bottom_layout.addWidget(self.btn_add_image)
+        bottom_layout.addWidget(self.btn_duplicate)
         bottom_layout.addWidget(self.btn_finish_or_bg)
         bottom_layout.addWidget(self.btn_save)
+        bottom_layout.addWidget(self.btn_fit_view)
+        bottom_layout.addWidget(self.label_zoom)
 
         main_layout.addLayout(bottom_layout)
 
+        # 편집 버튼 - 되돌리기 / 다시 하기 / 선택 이미지 삭제 / 색상 변경
+        edit_layout = QHBoxLayout()
+        self.btn_undo = QPushButton("되돌리기")
+        self.btn_redo = QPushButton("다시 하기")
+        self.btn_remove = QPushButton("선택 이미지 삭제")
+        self.btn_recolor = QPushButton("선택 이미지 색상 변경")
+
+        edit_layout.addWidget(self.btn_undo)
+        edit_layout.addWidget(self.btn_redo)
+        edit_layout.addWidget(self.btn_remove)
+        edit_layout.addWidget(self.btn_recolor)
+        edit_layout.addStretch(1)
+
+        main_layout.addLayout(edit_layout)
+
         # 배경색 조절 슬라이더
         bg_slider_layout = QHBoxLayout()
         self.bg_slider_r = QSlider(Qt.Horizontal)
@@ -152,17 +225,69 @@ class MainWindow(QMainWindow):
 
         main_layout.addLayout(bg_slider_layout)
 
+        # 선택 이미지 선 두께 / 부드러움 슬라이더 (편집 창과 같은 0.5 픽셀 단위)
+        style_layout = QHBoxLayout()
+        self.tile_slider_thickness = QSlider(Qt.Horizontal)
+        self.tile_slider_thickness.setRange(2, 30)
+        self.tile_slider_softness = QSlider(Qt.Horizontal)
+        self.tile_slider_softness.setRange(0, 8)
+        for s in (self.tile_slider_thickness, self.tile_slider_softness):
+            s.setEnabled(False)
+
+        style_layout.addWidget(QLabel("선택 이미지 선 두께"))
+        style_layout.addWidget(self.tile_slider_thickness)
+        style_layout.addWidget(QLabel("부드럽게"))
+        style_layout.addWidget(self.tile_slider_softness)
+
+        main_layout.addLayout(style_layout)
+
         central_widget.setLayout(main_layout)
         self.setCentralWidget(central_widget)
 
         self.btn_add_image.clicked.connect(self.on_add_image)
+        self.btn_duplicate.clicked.connect(self.on_duplicate_image)
         self.btn_finish_or_bg.clicked.connect(self.on_finish_or_bg_clicked)
         self.btn_save.clicked.connect(self.on_save)
+        self.btn_fit_view.clicked.connect(self.on_fit_view)
+        self.btn_undo.clicked.connect(self.on_undo)
+        self.btn_redo.clicked.connect(self.on_redo)
+        self.btn_remove.clicked.connect(self.on_remove_image)
+        self.btn_recolor.clicked.connect(self.on_recolor_image)
+
+        for keys, slot in (
+            (QKeySequence.Undo, self.on_undo),
+            (QKeySequence.Redo, self.on_redo),
+            (QKeySequence("Ctrl+Y"), self.on_redo),
+            (QKeySequence.Delete, self.on_remove_image),
+        ):
+            QShortcut(keys, self, activated=slot)
 
         self.bg_slider_r.valueChanged.connect(self.on_bg_color_changed)
         self.bg_slider_g.valueChanged.connect(self.on_bg_color_changed)
         self.bg_slider_b.valueChanged.connect(self.on_bg_color_changed)
 
+        self.tile_slider_thickness.valueChanged.connect(self.on_tile_style_changed)
+        self.tile_slider_softness.valueChanged.connect(self.on_tile_style_changed)
+        self.update_edit_buttons()
+
+        # 메모리 사용량 표시
+        self.label_memory = QLabel()
+        self.statusBar().addPermanentWidget(self.label_memory)
+        self.memory = get_memory_manager()
+        self.memory_changed.connect(self.update_memory_label)
+        self.memory.add_listener(self.on_memory_changed)
+        self.update_memory_label()
+
+    @property
+    def tile_registry(self):
+        """
+        타일 레지스트리 (처음 타일을 만들 때 생성)
+        """
+        if self._tile_registry is None:
+            from tile_registry import TileRegistry
+            self._tile_registry = TileRegistry()
+        return self._tile_registry
+
     # 캔버스
 
     def set_canvas_size(self, w, h):
@@ -178,6 +303,7 @@ class MainWindow(QMainWindow):
             f"이미지를 추가하여 콜라주를 만들 수 있습니다."
         )
         self.btn_add_image.setEnabled(True)
+        self.btn_duplicate.setEnabled(True)
         self.btn_finish_or_bg.setEnabled(True)
         self.btn_save.setEnabled(True)
 
@@ -192,96 +318,218 @@ class MainWindow(QMainWindow):
         self.next_y = 0
         self.current_row_height = 0
         self.image_placement_locked = False
-        self.current_canvas_qimage = None
 
-        self.preview_scale = 1.0
-        self.preview_offset_x = 0
-        self.preview_offset_y = 0
+        self.viewport.set_canvas_size(self.canvas_width, self.canvas_height)
+        self.panning = False
         self.dragging_index = None
+        self.select_image(None)
 
         self.btn_finish_or_bg.setText("이미지 추가 완료 -> 배경색 설정 모드로")
         self.btn_add_image.setEnabled(False)
+        self.btn_duplicate.setEnabled(False)
 
         for s in (self.bg_slider_r, self.bg_slider_g, self.bg_slider_b):
             s.setValue(0)
             s.setEnabled(False)
 
-    def update_canvas_preview(self):
+        self.history.clear()
+        self.update_edit_buttons()
+
+    def update_canvas_preview(self, dirty=None):
         """
-        현재 배경색 + 배치된 외곽선 이미지를 올린 캔버스를 생성하고 중앙에서 축소해서 미리보기로 보여줌
-        + 축소 비율 / 오프셋을 저장해서 마우스 좌표를 캔버스 좌표로 변환할 수 있게 함
+        현재 배경색 + 배치된 외곽선 이미지를 라벨 크기의 화면에 그림
+        - 캔버스 전체를 만들지 않고, 보이는 영역과 겹치는 타일만 화면 배율로 그림
+        - 그리는 비용은 캔버스 크기가 아니라 라벨 픽셀 수와 보이는 타일 수에 비례
+        - 상호작용 중(빠른 모드)에는 낮은 해상도로 그리고 최근접 보간으로 늘려서 표시
+        - dirty(바뀐 캔버스 영역 (x0, y0, x1, y1))가 주어지고 화면 변환이 그대로면
+          이전 프레임에서 그 영역과 겹치는 타일만 다시 그림 (되돌리기 / 삭제 등)
         """
         if self.canvas_width <= 0 or self.canvas_height <= 0:
             return
 
-        # 실제 캔버스(QImage) 생성
-        canvas_qimage = QImage(
-            self.canvas_width,
-            self.canvas_height,
-            QImage.Format_RGB888
-        )
+        label_w = self.canvas_label.width()
+        label_h = self.canvas_label.height()
+        if label_w <= 0 or label_h <= 0:
+            return
 
-        r = self.bg_slider_r.value()
-        g = self.bg_slider_g.value()
-        b = self.bg_slider_b.value()
-        canvas_qimage.fill(QColor(r, g, b))
+        vp = self.viewport
+        vp.set_view_size(label_w, label_h)
 
-        painter = QPainter(canvas_qimage)
-        for img, x, y, w, h in self.placed_images:
-            pix = QPixmap.fromImage(img).scaled(
-                w, h,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
+        mode = self.render_policy.mode
+        smooth = mode == SMOOTH
+        # 프레임 해상도 비율 - 라벨 좌표에 곱해서 프레임 좌표로 씀
+        fs = self.render_policy.render_scale()
+        scale = vp.scale * fs
+
+        view_key = (
+            label_w, label_h, vp.zoom, vp.center_x, vp.center_y,
+            self.canvas_width, self.canvas_height
+        )
+        partial = (
+            dirty is not None and mode == SMOOTH
+            and self.preview_frame is not None and self.preview_view_key == view_key
+        )
+
+        if partial:
+            frame = self.preview_frame
+        else:
+            frame = QImage(
+                max(1, int(label_w * fs)), max(1, int(label_h * fs)),
+                QImage.Format_RGB32
             )
-            painter.drawPixmap(x, y, pix)
+            frame.fill(QColor(0x22, 0x22, 0x22))
+
+        painter = QPainter(frame)
+
+        # 보이는 영역 (다시 그릴 영역만 그릴 때는 그 영역 - 보간 번짐만큼 여유)
+        vx0, vy0, vx1, vy1 = vp.visible_canvas_rect()
+        if partial:
+            margin = 2 / scale
+            vx0 = max(vx0, dirty[0] - margin)
+            vy0 = max(vy0, dirty[1] - margin)
+            vx1 = min(vx1, dirty[2] + margin)
+            vy1 = min(vy1, dirty[3] + margin)
+            if vx0 >= vx1 or vy0 >= vy1:
+                painter.end()
+                return
+            lx0, ly0 = vp.canvas_to_label(vx0, vy0)
+            lx1, ly1 = vp.canvas_to_label(vx1, vy1)
+            painter.setClipRect(QRectF(lx0, ly0, lx1 - lx0, ly1 - ly0))
+
+        # 캔버스(배경색) 영역
+        left, top = vp.canvas_to_label(0, 0)
+        right, bottom = vp.canvas_to_label(self.canvas_width, self.canvas_height)
+        canvas_rect = QRectF(left * fs, top * fs, (right - left) * fs, (bottom - top) * fs)
+        painter.fillRect(canvas_rect, self.current_bg_color())
+        painter.setClipRect(canvas_rect, Qt.IntersectClip if partial else Qt.ReplaceClip)
+
+        # 보이는 영역과 겹치는 타일만 그림
+        for tile, x, y, w, h in self.placed_images:
+            if x + w <= vx0 or x >= vx1 or y + h <= vy0 or y >= vy1:
+                continue
+            lx, ly = vp.canvas_to_label(x, y)
+            tile.paint_view(painter, lx * fs, ly * fs, w * scale, h * scale, smooth)
 
         painter.end()
 
-        self.current_canvas_qimage = canvas_qimage
+        # 부드러운 원본 해상도 프레임만 다음 부분 갱신에 재사용
+        if fs == 1.0:
+            self.preview_frame = frame
+            self.preview_view_key = view_key
+        else:
+            self.preview_frame = None
 
-        # 미리보기용 사이즈 계산
-        label_w = self.canvas_label.width()
-        label_h = self.canvas_label.height()
-        if label_w <= 0 or label_h <= 0:
-            return
+        pix = QPixmap.fromImage(frame)
+        if fs != 1.0:
+            pix = pix.scaled(label_w, label_h, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+        self.canvas_label.setPixmap(pix)
+        self.label_zoom.setText(f"{vp.scale * 100:.0f}%")
+        self.render_policy.report_frame(mode)
+
+    def on_render_frame_reported(self, mode):
+        """
+        마지막으로 그린 프레임의 화질 모드를 상태 표시줄에 표시
+        """
+        text = "빠르게" if mode != SMOOTH else "부드럽게"
+        self.statusBar().showMessage(f"미리보기 렌더링: {text}")
+
+    def on_memory_changed(self, manager):
+        self.memory_changed.emit()
+
+    def closeEvent(self, event):
+        """
+        창이 닫히면 메모리 관리자 알림을 끊음 (종료 중 타일 정리 알림이 삭제된 창으로 가지 않도록)
+        """
+        self.memory.remove_listener(self.on_memory_changed)
+        super().closeEvent(event)
+
+    def update_memory_label(self):
+        """
+        상태 표시줄의 메모리 사용량 / 예산과 카테고리별 내역(툴팁) 갱신
+        """
+        usage = self.memory.usage()
+        self.label_memory.setText(
+            f"메모리: {format_bytes(self.memory.total_bytes())} / "
+            f"{format_bytes(self.memory.budget_bytes)}"
+        )
+        self.label_memory.setToolTip("\n".join(
+            f"{category}: {format_bytes(nbytes)}"
+            for category, nbytes in sorted(usage.items(), key=lambda kv: -kv[1])
+        ) or "사용 중인 이미지 없음")
+
+    def current_bg_color(self):
+        return QColor(
+            self.bg_slider_r.value(),
+            self.bg_slider_g.value(),
+            self.bg_slider_b.value()
+        )
 
-        scale = min(label_w / self.canvas_width, label_h / self.canvas_height)
-        disp_w = int(self.canvas_width * scale)
-        disp_h = int(self.canvas_height * scale)
-        offset_x = (label_w - disp_w) // 2
-        offset_y = (label_h - disp_h) // 2
-
-        self.preview_scale = scale
-        self.preview_offset_x = offset_x
-        self.preview_offset_y = offset_y
-
-        display_pix = QPixmap.fromImage(canvas_qimage).scaled(
-            disp_w,
-            disp_h,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
+    def render_full_canvas(self):
+        """
+        저장용 - 실제 해상도의 캔버스(QImage)를 만들어 반환
+        """
+        canvas_qimage = QImage(
+            self.canvas_width,
+            self.canvas_height,
+            QImage.Format_RGB888
         )
+        canvas_qimage.fill(self.current_bg_color())
 
-        # 배경은 그대로 두고 offset 위치에만 그림을 그릴 수는 없으니, 여기서는 그냥 scaled pixmap만 설정
-        self.canvas_label.setPixmap(display_pix)
-        self.canvas_label.setAlignment(Qt.AlignCenter)
+        painter = QPainter(canvas_qimage)
+        for tile, x, y, w, h in self.placed_images:
+            tile.paint(painter, x, y, w, h)
+        painter.end()
+        return canvas_qimage
+
+    def set_bg_color(self, color):
+        """
+        배경색 (R, G, B)을 슬라이더에 반영 (되돌리기용 - 기록하지 않음)
+        """
+        self.bg_color = tuple(color)
+        for s, v in zip((self.bg_slider_r, self.bg_slider_g, self.bg_slider_b), color):
+            s.blockSignals(True)
+            s.setValue(v)
+            s.blockSignals(False)
 
     # 좌표 변환
 
     def label_pos_to_canvas_pos(self, pos: QPoint):
         """
-        라벨 좌표(pos)를 실제 캔버스 좌표로 변환
-        (preview_scale, preview_offset_x/y 사용)
+        라벨 좌표(pos)를 실제 캔버스 좌표로 변환 (viewport 사용)
+        - 확대 상태에서도 라벨 픽셀이 덮는 캔버스 픽셀로 정확히 내림
+        """
+        x, y = self.viewport.label_to_canvas(pos.x(), pos.y())
+        return math.floor(x), math.floor(y)
+
+    # 확대 / 이동
+
+    def on_canvas_wheel(self, event):
+        """
+        휠 - 마우스 위치를 기준으로 확대/축소
+        """
+        if self.canvas_width <= 0 or self.canvas_height <= 0:
+            return
+
+        steps = event.angleDelta().y() / 120
+        if steps == 0:
+            return
+        pos = event.pos()
+        self.viewport.zoom_at(pos.x(), pos.y(), 1.25 ** steps)
+        self.render_policy.interact()
+        self.update_canvas_preview()
+
+    def on_fit_view(self):
+        """
+        전체 보기로 되돌림
         """
-        x = (pos.x() - self.preview_offset_x) / self.preview_scale
-        y = (pos.y() - self.preview_offset_y) / self.preview_scale
-        return int(x), int(y)
+        self.viewport.reset()
+        self.update_canvas_preview()
 
     # 이미지 추가
 
     def on_add_image(self):
         """
-        외곽선 이미지 QImage(RGBA)를 메인 캔버스에 배치
+        편집 창에서 받은 외곽선(여러 개일 수 있음)을 공유 타일로 등록해서 메인 캔버스에 배치
         """
         if self.image_placement_locked:
             QMessageBox.information(
@@ -295,23 +543,47 @@ class MainWindow(QMainWindow):
             )
             return
 
+        from image_editor_dialog import ImageEditorDialog
+
         dialog = ImageEditorDialog(self)
 
         from PyQt5.QtWidgets import QDialog  # 여기서 import 해줘도 됨
 
-        if dialog.exec_() == QDialog.Accepted:
-            result_qimage = dialog.result_qimage
-            if result_qimage is None:
-                return
-            self.place_image_on_canvas(result_qimage)
-            self.update_canvas_preview()
+        try:
+            if dialog.exec_() == QDialog.Accepted:
+                if not dialog.results:
+                    return
+                # 한 번에 보낸 타일들은 되돌리기 한 번으로 함께 빠짐
+                with self.history.grouped():
+                    for kind, data, color, style in dialog.results:
+                        if not self.place_image_on_canvas(
+                            self.tile_from_result(kind, data, color, style)
+                        ):
+                            break
+                self.update_edit_buttons()
+                self.update_canvas_preview()
+        finally:
+            # 부모(메인 창)가 닫힌 편집 창을 계속 들고 있지 않도록 정리
+            dialog.deleteLater()
+
+    def tile_from_result(self, kind, data, color, style):
+        """
+        편집 창 결과 하나를 레지스트리의 공유 타일로 변환
+        """
+        thickness, softness = style
+        if kind == "vector":
+            points, starts, size = data
+            return self.tile_registry.get_vector_tile(
+                points, starts, size, color, thickness
+            )
+        return self.tile_registry.get_tile(data, color, thickness, softness)
 
-    def place_image_on_canvas(self, qimage_rgba: QImage):
+    def place_image_on_canvas(self, tile):
         """
-        QImage를 캔버스에 배치
+        타일을 캔버스에 배치 (너무 크면 축소)
         """
-        img_w = qimage_rgba.width()
-        img_h = qimage_rgba.height()
+        img_w = tile.width
+        img_h = tile.height
 
         if img_w <= 0 or img_h <= 0:
             return
@@ -321,25 +593,67 @@ class MainWindow(QMainWindow):
         scale_factor = 1.0
         if img_w > max_tile_width:
             scale_factor = max_tile_width / img_w
-            img_w = int(img_w * scale_factor)
-            img_h = int(img_h * scale_factor)
+            img_w = max(1, int(img_w * scale_factor))
+            img_h = max(1, int(img_h * scale_factor))
+
+        return self.place_tile_at_next_slot(tile, img_w, img_h)
+
+    def place_tile_at_next_slot(self, tile, img_w, img_h):
+        """
+        다음 배치 위치에 (img_w, img_h) 크기로 타일을 놓음
+        - 성공하면 True
+        """
+        before = (self.next_x, self.next_y, self.current_row_height)
+        x, y, row_height = before
 
         # 가로 초과 시 줄바꿈
-        if self.next_x + img_w > self.canvas_width:
-            self.next_x = 0
-            self.next_y += self.current_row_height
-            self.current_row_height = 0
+        if x + img_w > self.canvas_width:
+            x = 0
+            y += row_height
+            row_height = 0
 
         # 세로 초과 시 배치 불가
-        if self.next_y + img_h > self.canvas_height:
+        if y + img_h > self.canvas_height:
             QMessageBox.warning(
                 self, "경고", "캔버스에 이미지를 배치할 공간이 부족합니다."
             )
+            return False
+
+        # 배치 위치도 명령에 담아서 되돌리면 빈 자리부터 다시 채움
+        after = (x + img_w, y, max(row_height, img_h))
+        self.history.do(PlaceCommand(
+            len(self.placed_images), (tile, x, y, img_w, img_h), before, after
+        ))
+        return True
+
+    def set_placement_cursor(self, cursor):
+        """
+        자동 배치 위치 (next_x, next_y, 현재 줄 높이) 설정 (되돌리기용)
+        """
+        self.next_x, self.next_y, self.current_row_height = cursor
+
+    def on_duplicate_image(self):
+        """
+        선택된 이미지를 같은 크기로 한 번 더 배치
+        - 타일 객체를 그대로 공유하므로 추가 픽셀 메모리가 들지 않음
+        """
+        if self.image_placement_locked:
+            QMessageBox.information(
+                self, "알림", "이미지 추가 완료 후에는 더 이상 이미지를 추가할 수 없습니다."
+            )
             return
 
-        self.placed_images.append((qimage_rgba, self.next_x, self.next_y, img_w, img_h))
-        self.next_x += img_w
-        self.current_row_height = max(self.current_row_height, img_h)
+        if self.selected_index is None:
+            QMessageBox.information(
+                self, "알림", "먼저 캔버스에서 복제할 이미지를 클릭해주세요."
+            )
+            return
+
+        tile, _, _, w, h = self.placed_images[self.selected_index]
+        if self.place_tile_at_next_slot(tile, w, h):
+            self.select_image(len(self.placed_images) - 1)
+            self.update_edit_buttons()
+            self.update_canvas_preview()
 
     # 이미지 추가 완료 / 배경색 모드
 
@@ -350,6 +664,7 @@ class MainWindow(QMainWindow):
         if not self.image_placement_locked:
             self.image_placement_locked = True
             self.btn_add_image.setEnabled(False)
+            self.btn_duplicate.setEnabled(False)
 
             for s in (self.bg_slider_r, self.bg_slider_g, self.bg_slider_b):
                 s.setEnabled(True)
@@ -368,10 +683,153 @@ class MainWindow(QMainWindow):
     def on_bg_color_changed(self, value):
         """
         배경색 슬라이더 값 변경 - 캔버스 갱신
+        - 슬라이더를 멈출 때까지의 변경은 되돌리기 항목 하나로 합침
         """
+        color = self.current_bg_color()
+        new_color = (color.red(), color.green(), color.blue())
+        self.history.record(BackgroundCommand(self.bg_color, new_color), coalesce="bg")
+        self.bg_color = new_color
+        self.update_edit_buttons()
+
         if self.canvas_width > 0 and self.canvas_height > 0:
+            self.render_policy.interact()
             self.update_canvas_preview()
 
+    # 선택 이미지 선 두께 / 부드러움
+
+    def select_image(self, idx):
+        """
+        선택 이미지를 바꾸고 두께 슬라이더를 그 이미지의 값으로 맞춤
+        """
+        self.selected_index = idx
+
+        sliders = (self.tile_slider_thickness, self.tile_slider_softness)
+        for s in sliders:
+            s.blockSignals(True)
+
+        if idx is None:
+            for s in sliders:
+                s.setEnabled(False)
+        else:
+            tile = self.placed_images[idx][0]
+            self.tile_slider_thickness.setValue(int(round(tile.thickness * 2)))
+            self.tile_slider_thickness.setEnabled(True)
+            from vector_tile import VectorTile
+
+            if isinstance(tile, VectorTile):
+                # 벡터 타일은 항상 안티에일리어싱으로 그리므로 부드러움 없음
+                self.tile_slider_softness.setValue(0)
+                self.tile_slider_softness.setEnabled(False)
+            else:
+                self.tile_slider_softness.setValue(int(round(tile.softness * 2)))
+                self.tile_slider_softness.setEnabled(True)
+
+        for s in sliders:
+            s.blockSignals(False)
+
+    def on_tile_style_changed(self, value):
+        """
+        선택 이미지의 선 두께 / 부드러움 변경
+        - 같은 마스크의 공유 거리 맵으로 다시 칠한 타일로 교체 (Canny 재실행 없음)
+        """
+        if self.selected_index is None:
+            return
+
+        tile = self.placed_images[self.selected_index][0]
+        new_tile = self.tile_registry.restyle(
+            tile,
+            self.tile_slider_thickness.value() * 0.5,
+            self.tile_slider_softness.value() * 0.5
+        )
+        self.history.do(
+            RetileCommand(self.selected_index, tile, new_tile),
+            coalesce=("style", self.selected_index)
+        )
+        self.update_edit_buttons()
+        self.render_policy.interact()
+        self.update_canvas_preview()
+
+    # 선택 이미지 삭제 / 색상 변경
+
+    def on_remove_image(self):
+        """
+        선택된 이미지를 캔버스에서 뺌 (되돌리기 가능)
+        """
+        if self.selected_index is None or self.dragging_index is not None:
+            return
+
+        idx = self.selected_index
+        dirty = self.history.do(RemoveCommand(idx, self.placed_images[idx]))
+        self.select_image(None)
+        self.update_edit_buttons()
+        self.update_canvas_preview(dirty)
+
+    def on_recolor_image(self):
+        """
+        선택된 이미지의 외곽선 색상 변경 (같은 마스크를 공유하는 타일로 교체)
+        """
+        if self.selected_index is None:
+            QMessageBox.information(
+                self, "알림", "먼저 캔버스에서 색상을 바꿀 이미지를 클릭해주세요."
+            )
+            return
+
+        idx = self.selected_index
+        tile = self.placed_images[idx][0]
+        color = QColorDialog.getColor(QColor(*tile.color), self, "외곽선 색상")
+        if not color.isValid():
+            return
+
+        new_tile = self.tile_registry.recolor(
+            tile, (color.red(), color.green(), color.blue())
+        )
+        if new_tile is tile:
+            return
+        dirty = self.history.do(RetileCommand(idx, tile, new_tile))
+        self.update_edit_buttons()
+        self.update_canvas_preview(dirty)
+
+    # 되돌리기 / 다시 하기
+
+    def on_undo(self):
+        if self.dragging_index is not None:
+            return
+        self.replay_history(self.history.undo)
+
+    def on_redo(self):
+        if self.dragging_index is not None:
+            return
+        self.replay_history(self.history.redo)
+
+    def replay_history(self, step):
+        """
+        undo / redo 한 단계 실행 후 바뀐 영역만 다시 그림
+        - 선택은 인덱스가 아니라 배치 항목으로 따라감
+          (배치 / 삭제를 되돌리면 뒤쪽 인덱스가 밀리므로)
+        - 선택된 항목 자체가 바뀌었으면 (이동 / 타일 교체) 같은 자리의 항목을 유지,
+          목록 길이가 바뀌어 알 수 없으면 선택 해제
+        """
+        idx = self.selected_index
+        selected = self.placed_images[idx] if idx is not None else None
+        count = len(self.placed_images)
+
+        done, dirty = step()
+        if not done:
+            return
+
+        if selected is not None:
+            idx = next(
+                (i for i, entry in enumerate(self.placed_images) if entry is selected),
+                idx if len(self.placed_images) == count else None
+            )
+        self.select_image(idx)
+        self.update_edit_buttons()
+        self.update_canvas_preview(dirty)
+
+    def update_edit_buttons(self):
+        self.btn_undo.setEnabled(self.history.can_undo())
+        self.btn_redo.setEnabled(self.history.can_redo())
+
     # 마우스 드래그로 이미지 이동
 
     def find_image_at_canvas_pos(self, x, y):
@@ -388,11 +846,16 @@ class MainWindow(QMainWindow):
     def on_canvas_mouse_press(self, event):
         """
         드래그 시작: 클릭한 위치에 이미지가 있으면 그 이미지를 선택
+        - 빈 곳을 누르거나 가운데/오른쪽 버튼이면 화면 이동 시작
         """
-        if event.button() != Qt.LeftButton:
+        if self.canvas_width <= 0 or self.canvas_height <= 0:
             return
 
-        if self.canvas_width <= 0 or self.canvas_height <= 0:
+        if event.button() in (Qt.MiddleButton, Qt.RightButton):
+            self.start_pan(event.pos())
+            return
+
+        if event.button() != Qt.LeftButton:
             return
 
         # 라벨 좌표 → 캔버스 좌표
@@ -401,17 +864,33 @@ class MainWindow(QMainWindow):
         idx = self.find_image_at_canvas_pos(canvas_x, canvas_y)
         if idx is None:
             self.dragging_index = None
+            self.select_image(None)
+            self.start_pan(event.pos())
             return
 
         self.dragging_index = idx
+        self.select_image(idx)
         img, ix, iy, iw, ih = self.placed_images[idx]
         # 클릭한 지점이 이미지 내부에서 얼마만큼 떨어져 있는지 저장 (드래그 시 유지)
         self.drag_offset_in_image = QPoint(canvas_x - ix, canvas_y - iy)
+        self.drag_start_pos = (ix, iy)
 
     def on_canvas_mouse_move(self, event):
         """
         드래그 중 - 선택된 이미지가 있으면 마우스 위치에 따라 이미지 이동
+        - 화면 이동 중이면 마우스가 움직인 만큼 화면을 이동
         """
+        if self.panning:
+            pos = event.pos()
+            self.viewport.pan(
+                pos.x() - self.pan_last_pos.x(),
+                pos.y() - self.pan_last_pos.y()
+            )
+            self.pan_last_pos = pos
+            self.render_policy.interact()
+            self.update_canvas_preview()
+            return
+
         if self.dragging_index is None:
             return
 
@@ -429,22 +908,36 @@ class MainWindow(QMainWindow):
 
         # 튜플 갱신
         self.placed_images[self.dragging_index] = (img, new_x, new_y, iw, ih)
+        self.render_policy.interact()
         self.update_canvas_preview()
 
     def on_canvas_mouse_release(self, event):
         """
         드래그 종료
         """
-        if event.button() == Qt.LeftButton:
+        if event.button() == Qt.LeftButton and self.dragging_index is not None:
+            # 드래그 한 번의 전체 이동량을 되돌리기 항목 하나로 기록
+            _, x, y, _, _ = self.placed_images[self.dragging_index]
+            x0, y0 = self.drag_start_pos
+            if (x, y) != (x0, y0):
+                self.history.record(MoveCommand(self.dragging_index, x - x0, y - y0))
+                self.update_edit_buttons()
             self.dragging_index = None
+            self.drag_start_pos = None
+        self.panning = False
+
+    def start_pan(self, pos):
+        self.panning = True
+        self.pan_last_pos = pos
 
     # 최종 결과 저장
 
     def on_save(self):
         """
         현재 캔버스를 이미지 파일로 저장
+        - .svg로 저장하면 벡터 타일은 폴리라인 그대로, 래스터 타일은 PNG로 내장
         """
-        if self.current_canvas_qimage is None:
+        if self.canvas_width <= 0 or self.canvas_height <= 0:
             QMessageBox.information(self, "알림", "저장할 이미지가 없습니다.")
             return
 
@@ -452,12 +945,35 @@ class MainWindow(QMainWindow):
             self,
             "저장할 파일 이름",
             "",
-            "PNG Image (*.png);;JPEG Image (*.jpg *.jpeg)"
+            "PNG Image (*.png);;JPEG Image (*.jpg *.jpeg);;SVG Vector (*.svg)"
         )
         if not file_path:
             return
 
-        if self.current_canvas_qimage.save(file_path):
+        if file_path.lower().endswith(".svg"):
+            saved = self.save_canvas_svg(file_path)
+        else:
+            saved = self.render_full_canvas().save(file_path)
+
+        if saved:
             QMessageBox.information(self, "완료", "이미지가 성공적으로 저장되었습니다.")
         else:
             QMessageBox.warning(self, "오류", "이미지 저장에 실패했습니다.")
+
+    def save_canvas_svg(self, file_path):
+        """
+        현재 배경색과 배치를 SVG 문서로 저장
+        """
+        color = self.current_bg_color()
+        bg_color = (color.red(), color.green(), color.blue())
+        from vector_tile import collage_to_svg
+
+        svg = collage_to_svg(
+            self.canvas_width, self.canvas_height, bg_color, self.placed_images
+        )
+        try:
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(svg)
+        except OSError:
+            return False
+        return True
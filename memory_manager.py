@@ -0,0 +1,214 @@
+import os
+import threading
+import types
+import weakref
+from collections import OrderedDict
+
+
+# 기본 메모리 예산 (MB) - 환경 변수 OUTLINE_MEMORY_BUDGET_MB 로 바꿀 수 있음
+DEFAULT_BUDGET_MB = 1024
+
+
+class _Entry:
+
+    __slots__ = ("category", "nbytes", "evict")
+
+    def __init__(self, category, nbytes, evict):
+        self.category = category
+        self.nbytes = nbytes
+        self.evict = evict
+
+
+class MemoryManager:
+
+    """
+    이미지 / 프록시 / 캐시 메모리 예산 관리
+    - 객체(owner)마다 이름을 붙여 카테고리별 바이트 수를 기록
+    - evict 콜백이 있는 항목은 다시 만들 수 있는 데이터로 보고,
+      예산을 넘으면 가장 오래 쓰지 않은 것부터 evict 호출 (LRU)
+    - evict 콜백이 없는 항목은 원본 데이터 - 사용량에만 포함
+    - owner가 사라지면 기록도 자동으로 지워짐 (owner를 붙잡지 않음)
+    """
+    def __init__(self, budget_bytes):
+
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict()   # (id(owner), name) -> _Entry
+        self._finalizers = {}
+        self._usage = {}
+        self._listeners = []
+        self._lock = threading.RLock()
+
+    # 기록
+
+    def track(self, owner, name, category, nbytes, evict=None):
+        """
+        owner의 name 데이터를 nbytes로 기록 (이미 있으면 갱신) 후 예산 확인
+        - evict: 호출하면 그 데이터를 버리는 함수 (owner의 메서드면 약한 참조로 보관)
+        """
+        key = (id(owner), name)
+        if evict is not None:
+            evict = _weak_callable(evict)
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(category, nbytes, evict)
+            self._usage[category] = self._usage.get(category, 0) + nbytes
+            if key not in self._finalizers:
+                self._finalizers[key] = weakref.finalize(owner, self.release, owner_id=key[0], name=name)
+
+        self.enforce(keep=key)
+        self._notify()
+
+    def touch(self, owner, name):
+        """
+        최근에 사용했다고 표시 (LRU 순서 갱신)
+        """
+        key = (id(owner), name)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+    def release(self, owner=None, name=None, owner_id=None):
+        """
+        기록 삭제 - name이 없으면 owner의 모든 기록 삭제
+        """
+        if owner_id is None:
+            owner_id = id(owner)
+
+        with self._lock:
+            if name is not None:
+                keys = [(owner_id, name)]
+            else:
+                keys = [k for k in self._entries if k[0] == owner_id]
+            for key in keys:
+                self._remove(key)
+                finalizer = self._finalizers.pop(key, None)
+                if finalizer is not None:
+                    finalizer.detach()
+
+        self._notify()
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._usage[entry.category] -= entry.nbytes
+
+    # 예산
+
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.enforce()
+        self._notify()
+
+    def enforce(self, keep=None):
+        """
+        예산을 넘으면 다시 만들 수 있는 항목을 오래된 것부터 버림
+        - keep: 방금 기록한 항목은 버리지 않음
+        """
+        while True:
+            with self._lock:
+                if self.total_bytes() <= self.budget_bytes:
+                    return
+                victim = None
+                for key, entry in self._entries.items():
+                    if key != keep and entry.evict is not None:
+                        victim = key, entry
+                        break
+                if victim is None:
+                    return
+                key, entry = victim
+                self._remove(key)
+
+            evict = entry.evict()
+            if evict is not None:
+                evict()
+
+    # 조회
+
+    def total_bytes(self):
+        with self._lock:
+            return sum(self._usage.values())
+
+    def usage(self):
+        """
+        카테고리별 사용량 (bytes)
+        """
+        with self._lock:
+            return {k: v for k, v in self._usage.items() if v > 0}
+
+    def add_listener(self, callback):
+        """
+        사용량이 바뀔 때마다 callback(manager) 호출
+        - 객체의 메서드는 약한 참조로 보관 (관리자가 창 등을 붙잡아 두지 않음)
+        """
+        self._listeners.append(_weak_callable(callback))
+
+    def remove_listener(self, callback):
+        self._listeners = [
+            ref for ref in self._listeners
+            if ref() is not None and ref() != callback
+        ]
+
+    def _notify(self):
+        for ref in list(self._listeners):
+            callback = ref()
+            if callback is None:
+                # 주인이 사라진 리스너는 정리
+                if ref in self._listeners:
+                    self._listeners.remove(ref)
+                continue
+            callback(self)
+
+
+class _StrongRef:
+
+    """
+    WeakMethod와 같은 방식(호출하면 함수 반환)으로 일반 함수를 보관
+    """
+    __slots__ = ("func",)
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self):
+        return self.func
+
+
+"""
+객체의 메서드면 WeakMethod, 일반 함수면 그대로 - 둘 다 호출하면 함수(또는 None) 반환
+"""
+def _weak_callable(func):
+
+    if isinstance(func, types.MethodType):
+        return weakref.WeakMethod(func)
+    return _StrongRef(func)
+
+
+"""
+바이트 수를 사람이 읽기 쉬운 문자열로
+"""
+def format_bytes(nbytes) -> str:
+
+    for unit in ("B", "KB", "MB"):
+        if nbytes < 1024:
+            return f"{nbytes:.0f} {unit}" if unit == "B" else f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+    return f"{nbytes:.2f} GB"
+
+
+_manager = None
+
+
+"""
+프로그램 전체에서 공유하는 메모리 관리자
+"""
+def get_memory_manager() -> MemoryManager:
+
+    global _manager
+    if _manager is None:
+        try:
+            budget_mb = float(os.environ.get("OUTLINE_MEMORY_BUDGET_MB", DEFAULT_BUDGET_MB))
+        except ValueError:
+            budget_mb = DEFAULT_BUDGET_MB
+        _manager = MemoryManager(int(budget_mb * 1024 * 1024))
+    return _manager
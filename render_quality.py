@@ -0,0 +1,82 @@
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+
+
+FAST = "fast"
+SMOOTH = "smooth"
+
+# 마지막 상호작용 후 부드러운 화질로 다시 그리기까지 기다리는 시간 (ms)
+DEFAULT_IDLE_MS = 150
+# 빠른 모드에서 화면을 그릴 해상도 비율
+DEFAULT_PROXY_SCALE = 0.5
+
+
+class RenderQualityPolicy(QObject):
+
+    """
+    상호작용 중 화질 정책
+    - 드래그 / 슬라이더 조작 중에는 빠른 모드 (Fast 보간 + 저해상도 프록시)
+    - 마지막 조작 후 idle_ms가 지나면 부드러운 모드로 돌아가고 idle 시그널을 한 번 보냄
+      (받는 쪽에서 한 번만 부드러운 화질로 다시 그림)
+    - enabled=False면 항상 부드러운 모드
+    """
+    idle = pyqtSignal()
+    frame_reported = pyqtSignal(str)
+
+    def __init__(self, idle_ms=DEFAULT_IDLE_MS, proxy_scale=DEFAULT_PROXY_SCALE,
+                 enabled=True, parent=None):
+
+        super().__init__(parent)
+        self.idle_ms = idle_ms
+        self.proxy_scale = proxy_scale
+        self.enabled = enabled
+
+        self.interacting = False
+        self.last_mode = None
+        self.frame_counts = {FAST: 0, SMOOTH: 0}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_idle)
+
+    @property
+    def mode(self):
+        """
+        지금 그릴 프레임의 모드 (FAST / SMOOTH)
+        """
+        if self.enabled and self.interacting:
+            return FAST
+        return SMOOTH
+
+    def transformation_mode(self):
+        if self.mode == FAST:
+            return Qt.FastTransformation
+        return Qt.SmoothTransformation
+
+    def render_scale(self):
+        """
+        화면을 그릴 해상도 비율 (빠른 모드에서만 1 미만)
+        """
+        if self.mode == FAST:
+            return self.proxy_scale
+        return 1.0
+
+    def interact(self):
+        """
+        상호작용 이벤트마다 호출 - 빠른 모드로 바꾸고 idle 타이머를 다시 시작
+        """
+        if not self.enabled:
+            return
+        self.interacting = True
+        self._timer.start(self.idle_ms)
+
+    def report_frame(self, mode):
+        """
+        그린 프레임의 모드를 기록
+        """
+        self.last_mode = mode
+        self.frame_counts[mode] += 1
+        self.frame_reported.emit(mode)
+
+    def _on_idle(self):
+        self.interacting = False
+        self.idle.emit()
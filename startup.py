@@ -0,0 +1,127 @@
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from PyQt5.QtCore import QObject, QEvent
+
+
+# 창이 뜬 뒤 백그라운드에서 미리 import 해 둘 무거운 모듈
+# (첫 이미지 추가 때 기다리지 않도록)
+WARM_UP_MODULES = ("numpy", "cv2", "image_editor_dialog")
+
+
+class StartupProfiler:
+
+    """
+    시작 시간 측정 (--profile-startup)
+    - measure()로 감싼 구간별 시간과, 프로그램 시작부터 첫 화면 그리기까지의 시간을 기록
+    - 첫 화면이 그려지면 보고서를 stderr로 출력
+    - 비활성화 상태에서는 아무것도 기록하지 않음
+    """
+    def __init__(self, t0, enabled=True, stream=None):
+
+        self.t0 = t0
+        self.enabled = enabled
+        self.stream = stream or sys.stderr
+        self.steps = []
+        self._lock = threading.Lock()
+        self._filter = None
+
+    @contextmanager
+    def measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.steps.append((name, seconds))
+
+    def elapsed(self):
+        return time.perf_counter() - self.t0
+
+    def watch_first_paint(self, widget, on_painted=None):
+        """
+        widget이 처음 그려지는 시점을 기록하고 on_painted를 한 번 호출
+        """
+        self._filter = _FirstPaintFilter(self, widget, on_painted)
+        widget.installEventFilter(self._filter)
+
+    def first_painted(self):
+        if not self.enabled:
+            return
+        first_paint = self.elapsed()
+        heavy = [name for name in ("numpy", "cv2") if name in sys.modules]
+
+        with self._lock:
+            steps = list(self.steps)
+
+        lines = ["[startup profile]"]
+        for name, seconds in steps:
+            lines.append(f"  {name:<32} {seconds * 1000:8.1f} ms")
+        lines.append(f"  {'first paint (from start)':<32} {first_paint * 1000:8.1f} ms")
+        lines.append(
+            "  heavy modules before first paint: "
+            + (", ".join(heavy) if heavy else "none")
+        )
+        print("\n".join(lines), file=self.stream, flush=True)
+
+    def report_warm_up(self, timings):
+        if not self.enabled:
+            return
+        lines = ["[startup profile] background warm-up"]
+        for name, seconds in timings:
+            lines.append(f"  import {name:<25} {seconds * 1000:8.1f} ms")
+        print("\n".join(lines), file=self.stream, flush=True)
+
+
+class _FirstPaintFilter(QObject):
+
+    """
+    첫 Paint 이벤트만 잡아서 알려주는 이벤트 필터
+    """
+    def __init__(self, profiler, widget, on_painted):
+
+        super().__init__(widget)
+        self.profiler = profiler
+        self.widget = widget
+        self.on_painted = on_painted
+        self.done = False
+
+    def eventFilter(self, obj, event):
+        if not self.done and event.type() == QEvent.Paint:
+            self.done = True
+            self.profiler.first_painted()
+            if self.on_painted is not None:
+                self.on_painted()
+        return False
+
+
+"""
+무거운 모듈을 백그라운드 스레드에서 미리 import
+- 창을 그리는 GUI 스레드를 막지 않고 다음 '이미지 추가' 때의 대기 시간을 없앰
+- 끝나면 모듈별 import 시간을 on_done(timings)으로 넘김 (백그라운드 스레드에서 호출)
+"""
+def warm_up_in_background(module_names=WARM_UP_MODULES, on_done=None):
+
+    def run():
+        timings = []
+        for name in module_names:
+            start = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                continue
+            timings.append((name, time.perf_counter() - start))
+        if on_done is not None:
+            on_done(timings)
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
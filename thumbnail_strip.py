@@ -0,0 +1,113 @@
+from collections import OrderedDict
+
+import cv2
+from PyQt5.QtWidgets import QListView, QAbstractItemView
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QPoint
+
+from image_utils import numpy_gray_to_qimage
+
+
+class ThumbnailStripModel(QAbstractListModel):
+
+    """
+    외곽선 썸네일 목록 모델
+    - 항목에는 (이름, 외곽선 배열, 사용자 데이터)만 저장
+    - QPixmap은 뷰가 실제로 요청할 때(화면에 보일 때)만 만들고 최근 것 몇 개만 캐시
+    """
+    def __init__(self, thumb_height=72, cache_size=64, parent=None):
+
+        super().__init__(parent)
+        self.thumb_height = thumb_height
+        self.cache_size = cache_size
+        self.items = []
+        self._pixmaps = OrderedDict()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        label, edges, _ = self.items[index.row()]
+        if role == Qt.DisplayRole:
+            return label
+        if role == Qt.DecorationRole:
+            return self.thumbnail(index.row(), edges)
+        return None
+
+    def thumbnail(self, row, edges):
+        """
+        row 번째 항목의 썸네일 QPixmap (캐시에 없으면 그때 생성)
+        """
+        pix = self._pixmaps.get(row)
+        if pix is not None:
+            self._pixmaps.move_to_end(row)
+            return pix
+
+        h, w = edges.shape[:2]
+        scale = min(1.0, self.thumb_height / h)
+        small = cv2.resize(
+            edges,
+            (max(1, int(w * scale)), max(1, int(h * scale))),
+            interpolation=cv2.INTER_AREA
+        )
+        pix = QPixmap.fromImage(numpy_gray_to_qimage(small))
+
+        self._pixmaps[row] = pix
+        while len(self._pixmaps) > self.cache_size:
+            self._pixmaps.popitem(last=False)
+        return pix
+
+    def append(self, label, edges, user_data=None):
+        row = len(self.items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.items.append((label, edges, user_data))
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.items.clear()
+        self._pixmaps.clear()
+        self.endResetModel()
+
+    def user_data(self, row):
+        return self.items[row][2]
+
+
+class ThumbnailStrip(QListView):
+
+    """
+    가로 한 줄 썸네일 스트립
+    - 항목 크기가 모두 같다고 알려줘서 보이는 항목만 그리고 배치 계산도 생략
+    """
+    def __init__(self, thumb_height=72, parent=None):
+
+        super().__init__(parent)
+        self.strip_model = ThumbnailStripModel(thumb_height, parent=self)
+        self.setModel(self.strip_model)
+
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(False)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        self.setIconSize(QSize(thumb_height * 16 // 9, thumb_height))
+        self.setFixedHeight(thumb_height + 48)
+
+    def last_visible_row(self):
+        """
+        화면 오른쪽 끝에 보이는 항목 번호 (빈 곳까지 보이면 마지막 항목, 항목이 없으면 -1)
+        """
+        viewport = self.viewport()
+        index = self.indexAt(QPoint(viewport.width() - 1, viewport.height() // 2))
+        if index.isValid():
+            return index.row()
+        return self.strip_model.rowCount() - 1
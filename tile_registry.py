@@ -0,0 +1,349 @@
+import base64
+import hashlib
+import math
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice, QRectF
+from PyQt5.QtGui import QPainter
+
+from image_utils import numpy_bgra_to_qimage, edge_distance_map, colorize_edge_distance
+from memory_manager import get_memory_manager
+from vector_tile import VectorTile
+
+
+# 타일 하나가 들고 있을 크기별 렌더링 결과 개수
+# (드래그 중에는 크기가 바뀌지 않으므로 몇 개면 충분함)
+MAX_SCALED_VARIANTS = 4
+
+
+"""
+numpy 배열 내용 기반 해시 키 생성
+- 크기/타입이 다르면 같은 바이트라도 다른 키
+"""
+def content_key(arr: np.ndarray) -> str:
+
+    arr = np.ascontiguousarray(arr)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{arr.shape}{arr.dtype}".encode())
+    h.update(memoryview(arr).cast("B"))
+    return h.hexdigest()
+
+
+"""
+QImage가 차지하는 바이트 수
+"""
+def qimage_nbytes(img) -> int:
+
+    return img.bytesPerLine() * img.height()
+
+
+class EdgeMask:
+
+    """
+    외곽선 마스크(0/255) 원본
+    - 같은 내용의 마스크는 레지스트리에서 하나만 존재
+    - 읽기 전용으로 두어 여러 타일이 안전하게 공유
+    - 두께 변경용 거리 맵도 마스크당 한 번만 계산해서 모든 타일이 공유
+    - 거리 맵은 메모리 예산을 넘으면 버리고 다음 요청 때 다시 계산
+    """
+    __slots__ = ("key", "edges", "_distance", "__weakref__")
+
+    def __init__(self, key, edges):
+
+        # 다이얼로그 쪽 원본 배열의 일부(view)일 수 있으므로 한 번만 복사해서 소유
+        edges = np.array(edges, dtype=np.uint8, copy=True, order="C")
+        edges.setflags(write=False)
+        self.key = key
+        self.edges = edges
+        self._distance = None
+
+        # 마스크 자체는 원본이라 버릴 수 없음 - 사용량에만 포함
+        get_memory_manager().track(self, "edges", "tile_mask", edges.nbytes)
+
+    @property
+    def distance(self):
+        """
+        외곽선까지의 거리 맵 (처음 요청될 때 한 번만 계산)
+        """
+        memory = get_memory_manager()
+        if self._distance is None:
+            dist = edge_distance_map(self.edges)
+            dist.setflags(write=False)
+            self._distance = dist
+            memory.track(self, "distance", "tile_distance", dist.nbytes, self._evict_distance)
+        else:
+            memory.touch(self, "distance")
+        return self._distance
+
+    def _evict_distance(self):
+        self._distance = None
+
+    @property
+    def width(self):
+        return self.edges.shape[1]
+
+    @property
+    def height(self):
+        return self.edges.shape[0]
+
+    @property
+    def nbytes(self):
+        return self.edges.nbytes
+
+
+class EdgeTile:
+
+    """
+    캔버스에 배치되는 타일(플라이웨이트)
+    - 마스크 + 색상 + 선 두께 / 부드러움 조합마다 하나
+    - RGBA 원본과 크기별 축소본을 필요할 때 만들어 모든 배치가 공유
+    - 화면 미리보기용으로 1/2, 1/4 ... 밉맵도 필요할 때 만들어 공유
+    - 원본 / 축소본 / 밉맵은 모두 다시 만들 수 있으므로 메모리 예산을 넘으면 버려짐
+    """
+    __slots__ = ("mask", "color", "thickness", "softness",
+                 "_source", "_variants", "_mips", "__weakref__")
+
+    def __init__(self, mask: EdgeMask, color, thickness=1.0, softness=0.0):
+
+        self.mask = mask
+        self.color = tuple(color)
+        self.thickness = thickness
+        self.softness = softness
+        self._source = None
+        self._variants = OrderedDict()
+        self._mips = []
+
+    @property
+    def width(self):
+        return self.mask.width
+
+    @property
+    def height(self):
+        return self.mask.height
+
+    def source_image(self):
+        """
+        마스크를 색상으로 칠한 RGBA QImage (처음 요청될 때 한 번만 생성)
+        - 선 두께 / 부드러움은 마스크의 거리 맵에서 알파로 계산 (Canny를 다시 돌리지 않음)
+        """
+        memory = get_memory_manager()
+        if self._source is None:
+            if self.thickness == 1.0 and self.softness <= 0:
+                # 기본 1px 외곽선은 거리 맵 없이 마스크 그대로 사용
+                edges = self.mask.edges
+                h, w = edges.shape
+                bgra = np.zeros((h, w, 4), dtype=np.uint8)
+
+                mask = edges != 0
+                r, g, b = self.color
+                bgra[mask, 0] = b
+                bgra[mask, 1] = g
+                bgra[mask, 2] = r
+                bgra[mask, 3] = 255
+            else:
+                bgra = colorize_edge_distance(
+                    self.mask.distance, self.color, self.thickness, self.softness
+                )
+
+            self._source = numpy_bgra_to_qimage(bgra)
+            memory.track(
+                self, "source", "tile_source",
+                qimage_nbytes(self._source), self._evict_source
+            )
+        else:
+            memory.touch(self, "source")
+        return self._source
+
+    def _evict_source(self):
+        self._source = None
+
+    def scaled(self, w, h):
+        """
+        (w, h) 크기로 축소한 QImage
+        - 최근에 쓴 몇 개 크기만 캐시
+        """
+        key = (w, h)
+        img = self._variants.get(key)
+        if img is not None:
+            self._variants.move_to_end(key)
+            get_memory_manager().touch(self, "variants")
+            return img
+
+        img = self.source_image().scaled(
+            w, h,
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
+        )
+        self._variants[key] = img
+        while len(self._variants) > MAX_SCALED_VARIANTS:
+            self._variants.popitem(last=False)
+        get_memory_manager().track(
+            self, "variants", "tile_scaled",
+            sum(qimage_nbytes(v) for v in self._variants.values()), self._evict_variants
+        )
+        return img
+
+    def _evict_variants(self):
+        self._variants.clear()
+
+    def paint(self, painter, x, y, w, h):
+        """
+        painter 위 (x, y)에 (w, h) 크기로 타일을 그림
+        """
+        painter.drawImage(x, y, self.scaled(w, h))
+
+    def mip(self, level):
+        """
+        level 단계 밉맵 (0 = 원본, 단계마다 가로/세로 절반)
+        - _mips에는 1단계부터 저장 (0단계는 원본을 그대로 사용)
+        """
+        if level <= 0:
+            return self.source_image()
+
+        memory = get_memory_manager()
+        if len(self._mips) >= level:
+            memory.touch(self, "mips")
+            return self._mips[level - 1]
+
+        prev = self._mips[-1] if self._mips else self.source_image()
+        while len(self._mips) < level:
+            if prev.width() <= 1 and prev.height() <= 1:
+                break
+            prev = prev.scaled(
+                max(1, prev.width() // 2),
+                max(1, prev.height() // 2),
+                Qt.IgnoreAspectRatio,
+                Qt.SmoothTransformation
+            )
+            self._mips.append(prev)
+
+        memory.track(
+            self, "mips", "tile_mips",
+            sum(qimage_nbytes(m) for m in self._mips), self._evict_mips
+        )
+        return prev
+
+    def _evict_mips(self):
+        self._mips = []
+
+    def paint_view(self, painter, x, y, w, h, smooth=True):
+        """
+        화면 미리보기용 그리기 - (x, y, w, h)는 실수 화면 좌표
+        - 그릴 크기보다 크면서 가장 작은 밉맵을 골라 painter가 나머지를 보간
+        - smooth=False면 최근접 보간 (상호작용 중 빠른 모드)
+        """
+        if w <= 0 or h <= 0:
+            return
+
+        ratio = self.width / w
+        level = int(math.floor(math.log2(ratio))) if ratio > 1 else 0
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, smooth)
+        painter.drawImage(QRectF(x, y, w, h), self.mip(level))
+
+    def to_svg(self, x, y, w, h):
+        """
+        캔버스의 (x, y, w, h) 위치에 놓인 이 타일의 SVG 조각 (PNG 내장)
+        """
+        data = QByteArray()
+        buf = QBuffer(data)
+        buf.open(QIODevice.WriteOnly)
+        self.source_image().save(buf, "PNG")
+        buf.close()
+        encoded = base64.b64encode(bytes(data)).decode("ascii")
+        return (
+            f'<image x="{x}" y="{y}" width="{w}" height="{h}" '
+            f'preserveAspectRatio="xMinYMin meet" '
+            f'xlink:href="data:image/png;base64,{encoded}"/>'
+        )
+
+
+class TileRegistry:
+
+    """
+    타일 인터닝 레지스트리
+    - 마스크는 내용 해시로, 타일은 (마스크, 색상)으로 중복 제거
+    - 벡터 타일은 (점 배열 해시, 색상)으로 중복 제거
+    - 약한 참조로만 들고 있으므로 배치에서 빠진 타일은 자동으로 해제됨
+    """
+    def __init__(self):
+
+        self._masks = weakref.WeakValueDictionary()
+        self._tiles = weakref.WeakValueDictionary()
+
+    def intern_mask(self, edges) -> EdgeMask:
+        """
+        같은 내용의 마스크가 이미 있으면 그것을, 없으면 새로 등록해서 반환
+        """
+        if isinstance(edges, EdgeMask):
+            return edges
+
+        key = content_key(edges)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = EdgeMask(key, edges)
+            self._masks[key] = mask
+        return mask
+
+    def get_tile(self, edges, color, thickness=1.0, softness=0.0) -> EdgeTile:
+        """
+        외곽선 배열(또는 EdgeMask)과 색상, 선 두께 / 부드러움으로 공유 타일을 얻음
+        """
+        mask = self.intern_mask(edges)
+        key = (mask.key, tuple(color), thickness, softness)
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = EdgeTile(mask, color, thickness, softness)
+            self._tiles[key] = tile
+        return tile
+
+    def get_vector_tile(self, points, starts, size, color, thickness=1.0) -> VectorTile:
+        """
+        폴리라인 점 배열과 원본 크기(w, h), 색상, 선 두께로 공유 벡터 타일을 얻음
+        """
+        w, h = size
+        key = f"{content_key(points)}:{content_key(starts)}:{w}x{h}"
+        return self._vector_tile(key, points, starts, w, h, color, thickness)
+
+    def _vector_tile(self, key, points, starts, w, h, color, thickness):
+        tile_key = ("vector", key, tuple(color), thickness)
+        tile = self._tiles.get(tile_key)
+        if tile is None:
+            tile = VectorTile(key, points, starts, w, h, color, thickness)
+            self._tiles[tile_key] = tile
+        return tile
+
+    def restyle(self, tile, thickness, softness):
+        """
+        같은 원본(마스크 / 점 배열)과 색상으로 선 두께 / 부드러움만 바꾼 타일
+        - 래스터 타일은 공유 거리 맵으로 다시 칠하기만 하고, 벡터 타일은 펜 두께만 바뀜
+        """
+        if isinstance(tile, VectorTile):
+            return self._vector_tile(
+                tile.key, tile.points, tile.starts, tile.width, tile.height,
+                tile.color, thickness
+            )
+        return self.get_tile(tile.mask, tile.color, thickness, softness)
+
+    def recolor(self, tile, color):
+        """
+        같은 원본과 선 두께 / 부드러움으로 색상만 바꾼 타일
+        """
+        if isinstance(tile, VectorTile):
+            return self._vector_tile(
+                tile.key, tile.points, tile.starts, tile.width, tile.height,
+                color, tile.thickness
+            )
+        return self.get_tile(tile.mask, color, tile.thickness, tile.softness)
+
+    def stats(self):
+        """
+        현재 살아 있는 고유 마스크 / 타일 개수와 마스크 바이트 수
+        """
+        masks = list(self._masks.values())
+        return {
+            "masks": len(masks),
+            "tiles": len(self._tiles),
+            "mask_bytes": sum(m.nbytes for m in masks),
+        }
@@ -0,0 +1,175 @@
+import cv2
+import numpy as np
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QPainter, QPainterPath, QPen, QColor
+
+from memory_manager import get_memory_manager
+
+
+"""
+외곽선(0/255)을 단순화된 폴리라인으로 변환
+- findContours로 외곽선을 따라가고 approxPolyDP(tolerance 픽셀)로 점 개수를 줄임
+- 반환값: (points, starts)
+  points: 모든 폴리라인의 점을 이어붙인 (N, 2) int32 배열
+  starts: 각 폴리라인이 points에서 시작하는 위치 (마지막에 N 포함)
+"""
+def edges_to_polylines(edges: np.ndarray, tolerance: float):
+
+    contours, _ = cv2.findContours(
+        edges, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE
+    )
+
+    polylines = []
+    for c in contours:
+        if tolerance > 0:
+            c = cv2.approxPolyDP(c, tolerance, True)
+        if len(c) >= 2:
+            polylines.append(c.reshape(-1, 2))
+
+    if not polylines:
+        return np.zeros((0, 2), dtype=np.int32), np.zeros(1, dtype=np.int32)
+
+    lengths = [len(p) for p in polylines]
+    starts = np.zeros(len(lengths) + 1, dtype=np.int32)
+    starts[1:] = np.cumsum(lengths)
+    points = np.concatenate(polylines).astype(np.int32)
+    return points, starts
+
+
+"""
+(points, starts)를 폴리라인 배열 리스트로 나눔
+"""
+def split_polylines(points: np.ndarray, starts: np.ndarray):
+
+    return [points[starts[i]:starts[i + 1]] for i in range(len(starts) - 1)]
+
+
+"""
+폴리라인을 BGRA 배열 위에 직접 그림 (미리보기용)
+"""
+def draw_polylines_bgra(bgra: np.ndarray, points, starts, color_rgb, thickness=1.0):
+
+    r, g, b = color_rgb
+    cv2.polylines(
+        bgra,
+        [p.reshape(-1, 1, 2) for p in split_polylines(points, starts)],
+        True,
+        (b, g, r, 255),
+        max(1, int(round(thickness))),
+        cv2.LINE_AA
+    )
+    return bgra
+
+
+class VectorTile:
+
+    """
+    벡터 외곽선 타일
+    - 픽셀 대신 단순화된 폴리라인의 점 배열만 보관
+    - 어떤 크기로 그려도 선이 뭉개지지 않고, 그리는 비용은 외곽선 길이에 비례
+    """
+    __slots__ = ("key", "points", "starts", "width", "height", "color",
+                 "thickness", "_path", "__weakref__")
+
+    def __init__(self, key, points, starts, width, height, color, thickness=1.0):
+
+        points = np.array(points, dtype=np.int32, copy=True)
+        starts = np.array(starts, dtype=np.int32, copy=True)
+        points.setflags(write=False)
+        starts.setflags(write=False)
+
+        self.key = key
+        self.points = points
+        self.starts = starts
+        self.width = width
+        self.height = height
+        self.color = tuple(color)
+        self.thickness = thickness
+        self._path = None
+
+        # 점 배열은 원본이라 버릴 수 없음 - 사용량에만 포함
+        get_memory_manager().track(self, "points", "tile_vector", self.nbytes)
+
+    @property
+    def nbytes(self):
+        return self.points.nbytes + self.starts.nbytes
+
+    def path(self):
+        """
+        원본 좌표계 기준 QPainterPath (처음 요청될 때 한 번만 생성)
+        """
+        if self._path is None:
+            path = QPainterPath()
+            for poly in split_polylines(self.points, self.starts):
+                path.moveTo(QPointF(*poly[0]))
+                for px, py in poly[1:]:
+                    path.lineTo(QPointF(px, py))
+                path.closeSubpath()
+            self._path = path
+        return self._path
+
+    def paint(self, painter, x, y, w, h, smooth=True):
+        """
+        painter 위 (x, y)에 (w, h) 크기로 폴리라인을 그림
+        - 선 두께는 원본 픽셀 기준 (thickness * 배율), 단 화면에서 1px 보다 얇아지지 않음
+        - smooth=False면 안티에일리어싱 없이 그림 (상호작용 중 빠른 모드)
+        """
+        scale = min(w / self.width, h / self.height)
+        r, g, b = self.color
+        pen = QPen(QColor(r, g, b))
+        pen.setCosmetic(True)
+        pen.setWidthF(max(1.0, self.thickness * scale))
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, smooth)
+        painter.setPen(pen)
+        painter.setBrush(Qt.NoBrush)
+        painter.translate(x, y)
+        painter.scale(scale, scale)
+        painter.drawPath(self.path())
+        painter.restore()
+
+    def paint_view(self, painter, x, y, w, h, smooth=True):
+        """
+        화면 미리보기용 그리기 - 벡터는 배율과 관계없이 같은 방식으로 그림
+        """
+        self.paint(painter, x, y, w, h, smooth)
+
+    def to_svg(self, x, y, w, h):
+        """
+        캔버스의 (x, y, w, h) 위치에 놓인 이 타일의 SVG 조각
+        - 선 두께는 <g>의 scale이 적용되는 타일 좌표 기준으로 씀
+          (캔버스에서는 thickness * 배율, paint()처럼 1px 보다 얇아지지 않음)
+        """
+        scale = min(w / self.width, h / self.height)
+        r, g, b = self.color
+        lines = [
+            f'<g transform="translate({x} {y}) scale({scale:.6g})" '
+            f'fill="none" stroke="rgb({r},{g},{b})" '
+            f'stroke-width="{max(1.0 / scale, self.thickness):.6g}">'
+        ]
+        for poly in split_polylines(self.points, self.starts):
+            pts = " ".join(f"{px},{py}" for px, py in poly)
+            lines.append(f'<polygon points="{pts}"/>')
+        lines.append("</g>")
+        return "\n".join(lines)
+
+
+"""
+콜라주 전체를 SVG 문서 문자열로 만듦
+- placements: (tile, x, y, w, h) 목록 (EdgeTile / VectorTile 모두 to_svg 제공)
+"""
+def collage_to_svg(width, height, bg_color, placements) -> str:
+
+    r, g, b = bg_color
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+        f'<rect width="{width}" height="{height}" fill="rgb({r},{g},{b})"/>',
+    ]
+    for tile, x, y, w, h in placements:
+        parts.append(tile.to_svg(x, y, w, h))
+    parts.append("</svg>")
+    return "\n".join(parts)
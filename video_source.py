@@ -0,0 +1,270 @@
+import queue
+import threading
+
+import cv2
+
+from image_utils import extract_canny_edges
+
+
+class VideoFrameSource:
+
+    """
+    cv2.VideoCapture 기반 동영상 프레임 소스
+    - 전체를 디코딩하지 않고 필요한 프레임만 제너레이터로 흘려보냄
+    - 시간(초) 단위 이동, 프레임 간격(stride) / 키프레임만 샘플링 지원
+    """
+    def __init__(self, path):
+
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise IOError(f"동영상을 열 수 없습니다: {path}")
+
+        fps = self.cap.get(cv2.CAP_PROP_FPS)
+        self.fps = fps if fps and fps > 0 else 30.0
+        self.frame_count = max(0, int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+        self._gop_size = None
+
+    @property
+    def duration(self):
+        """
+        전체 길이 (초)
+        """
+        return self.frame_count / self.fps
+
+    def time_to_index(self, seconds):
+        return max(0, int(round(seconds * self.fps)))
+
+    def seek(self, seconds):
+        """
+        seconds 위치로 이동 (다음 read가 그 위치의 프레임을 돌려줌)
+        """
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.time_to_index(seconds))
+
+    def read_frame(self, index):
+        """
+        index 번째 프레임 하나만 디코딩해서 반환 (없으면 None)
+        """
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+        ok, frame = self.cap.read()
+        return frame if ok else None
+
+    def frames(self, start=0.0, stride=1, keyframes_only=False):
+        """
+        (프레임 번호, 시간(초), BGR 프레임)을 차례로 내보내는 제너레이터
+        - stride: 몇 프레임마다 하나씩 꺼낼지
+          - GOP(키프레임 간격)보다 짧으면 건너뛰는 프레임은 grab()으로 지나감
+            (FFmpeg 백엔드의 grab()도 디코딩은 하므로 색 변환/복사만 아낌)
+          - GOP 이상이면 꺼낼 프레임마다 바로 이동(seek) - 사이 프레임은 디코딩하지 않고
+            직전 키프레임부터 그 프레임까지만 디코딩
+        - keyframes_only: 키프레임 위치만 골라서 그 프레임만 디코딩
+        """
+        if keyframes_only:
+            keyframes = self.keyframe_indices(self.time_to_index(start))
+            if keyframes is not None:
+                for index in keyframes:
+                    frame = self.read_frame(index)
+                    if frame is None:
+                        return
+                    yield index, index / self.fps, frame
+                return
+            # 키프레임 정보를 얻을 수 없는 백엔드 - 약 1초 간격으로 대체
+            stride = max(stride, int(round(self.fps)))
+
+        stride = max(1, int(stride))
+        index = self.time_to_index(start)
+
+        if stride > 1 and stride >= self.gop_size():
+            while self.frame_count <= 0 or index < self.frame_count:
+                frame = self.read_frame(index)
+                if frame is None:
+                    return
+                yield index, index / self.fps, frame
+                index += stride
+            return
+
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+
+        while True:
+            ok, frame = self.cap.read()
+            if not ok:
+                return
+            yield index, index / self.fps, frame
+
+            for _ in range(stride - 1):
+                if not self.cap.grab():
+                    return
+            index += stride
+
+    def keyframe_indices(self, start_index=0):
+        """
+        키프레임 번호(표시 순서)를 차례로 내보내는 제너레이터
+        - 디코딩 없이 패킷만 읽는(raw) 캡처로 키프레임 플래그를 확인
+        - 패킷은 디코딩 순서로 오므로 (B 프레임이 있으면 표시 순서와 다름)
+          패킷 순번 대신 PTS로 표시 순서 프레임 번호를 구함 (read_frame이 쓰는 번호)
+        - 백엔드가 지원하지 않으면 None
+        """
+        raw = cv2.VideoCapture(
+            self.path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_FORMAT, -1]
+        )
+        if not raw.isOpened() or raw.get(cv2.CAP_PROP_FORMAT) != -1:
+            raw.release()
+            return None
+
+        def scan():
+            try:
+                while raw.grab():
+                    if not raw.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                        continue
+                    index = self.packet_frame_index(raw)
+                    if index >= start_index:
+                        yield index
+            finally:
+                raw.release()
+
+        return scan()
+
+    def gop_size(self):
+        """
+        키프레임 간격(프레임 수) - 앞쪽 키프레임 두 개의 간격으로 추정 (패킷만 읽음)
+        - 알 수 없으면 2초로 가정
+        """
+        if self._gop_size is None:
+            gop = None
+            keyframes = self.keyframe_indices()
+            if keyframes is not None:
+                try:
+                    first = next(keyframes, None)
+                    second = next(keyframes, None)
+                    if first is not None and second is not None and second > first:
+                        gop = second - first
+                finally:
+                    keyframes.close()
+            self._gop_size = gop or max(1, int(round(self.fps * 2)))
+        return self._gop_size
+
+    def packet_frame_index(self, raw):
+        """
+        raw 캡처가 방금 읽은 패킷의 표시 순서 프레임 번호
+        - CAP_PROP_PTS는 FPS 단위 PTS, 없으면 타임스탬프(ms)로 환산
+        """
+        pts = raw.get(cv2.CAP_PROP_PTS)
+        if pts is not None and pts >= 0:
+            return int(round(pts))
+        return max(0, int(round(raw.get(cv2.CAP_PROP_POS_MSEC) * self.fps / 1000)))
+
+    def close(self):
+        self.cap.release()
+
+
+class FramePrefetcher:
+
+    """
+    작업 스레드에서 프레임을 미리 읽어 외곽선 썸네일로 만들어 두는 클래스
+    - 큐 크기가 제한되어 있어서 소비하지 않으면 디코딩도 멈춤
+    - 허용된 개수(allow)만큼 만들면 멈추고, 스트립이 스크롤되어 더 허용되면 이어서 만듦
+      (동영상 끝까지 미리 디코딩하지 않음)
+    - 큐에는 작은 외곽선 썸네일만 들어가므로 원본 프레임은 한 번에 하나만 메모리에 있음
+    """
+    def __init__(self, path, start=0.0, stride=1, keyframes_only=False,
+                 thumb_width=160, max_prefetch=8, lookahead=24):
+
+        self.path = path
+        self.start = start
+        self.stride = stride
+        self.keyframes_only = keyframes_only
+        self.thumb_width = thumb_width
+
+        self.queue = queue.Queue(maxsize=max_prefetch)
+        self.finished = threading.Event()
+        self._stop = threading.Event()
+        self._allowed = lookahead
+        self._produced = 0
+        self._allowance = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start_worker(self):
+        self._thread.start()
+
+    def stop(self):
+        """
+        작업 스레드 종료 요청 후 대기
+        """
+        self._stop.set()
+        with self._allowance:
+            self._allowance.notify_all()
+        # 큐가 가득 차서 put에서 기다리고 있을 수 있으므로 비워줌
+        self.drain()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+
+    def drain(self, max_items=None):
+        """
+        지금까지 준비된 (프레임 번호, 시간, 외곽선 썸네일)을 꺼냄
+        """
+        items = []
+        while max_items is None or len(items) < max_items:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def allow(self, count):
+        """
+        처음부터 count개까지 썸네일을 만들도록 허용 (줄이지는 않음)
+        """
+        with self._allowance:
+            if count > self._allowed:
+                self._allowed = count
+                self._allowance.notify_all()
+
+    def _wait_for_allowance(self):
+        with self._allowance:
+            while self._produced >= self._allowed and not self._stop.is_set():
+                self._allowance.wait(0.1)
+        return not self._stop.is_set()
+
+    def is_done(self):
+        return self.finished.is_set() and self.queue.empty()
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        try:
+            source = VideoFrameSource(self.path)
+        except IOError:
+            self.finished.set()
+            return
+
+        try:
+            frames = source.frames(self.start, self.stride, self.keyframes_only)
+            while self._wait_for_allowance():
+                item = next(frames, None)
+                if item is None:
+                    break
+                index, t, frame = item
+
+                # 작게 줄인 다음 외곽선을 뽑아서 썸네일 비용을 줄임
+                h, w = frame.shape[:2]
+                scale = min(1.0, self.thumb_width / w)
+                small = cv2.resize(
+                    frame,
+                    (max(1, int(w * scale)), max(1, int(h * scale))),
+                    interpolation=cv2.INTER_AREA
+                )
+                del frame, item
+
+                if not self._put((index, t, extract_canny_edges(small))):
+                    break
+                self._produced += 1
+        finally:
+            source.close()
+            self.finished.set()